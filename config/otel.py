@@ -1,46 +1,100 @@
 import os
 import logging
+from functools import lru_cache
+
+# keep the collector channel warm between batches instead of reconnecting after idle periods
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", -1),
+    ("grpc.keepalive_time_ms", 30000),
+)
+
+# set once per process so repeated calls (manage.py, wsgi, reloader) don't stack handlers/hooks
+_otel_initialized = False
+
+
+@lru_cache(maxsize=None)
+def _get_resource():
+    """Build the OTel resource once per process so every provider shares the same attributes."""
+    from opentelemetry.sdk.resources import Resource
+
+    return Resource.create(attributes={
+        "service.name": os.environ.get("OTEL_SERVICE_NAME", "jRetireWise"),
+    })
 
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.sdk.resources import Resource
-from opentelemetry._logs import set_logger_provider, get_logger_provider
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor, ConsoleLogExporter
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
 
 def initialize_otel():
+    global _otel_initialized
+    if _otel_initialized:
+        return
+
+    # imported here so processes that never initialize OTel don't pay the import cost
+    from opentelemetry._logs import set_logger_provider, get_logger_provider
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+
     logger = logging.getLogger()
 
-    # Check if LoggerProvider already exists (e.g., from opentelemetry-instrument)
+    # Check if LoggerProvider already exists (e.g., from opentelemetry-instrument).
+    # get_logger_provider() returns a no-op proxy rather than None when nothing is set.
     logger_provider = get_logger_provider()
-    
-    if logger_provider is None:
+
+    if not isinstance(logger_provider, LoggerProvider):
         # No provider exists, create a new one
         otlp_export_endpoint = os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
         if not otlp_export_endpoint:
             logger.warning("OTEL_EXPORTER_OTLP_ENDPOINT not set, skipping OpenTelemetry log setup")
             return
 
+        from opentelemetry.sdk._logs.export import BatchLogRecordProcessor, ConsoleLogExporter
+        from grpc import Compression
+        from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+
         # add resource metadata to logs
-        resource = Resource.create(attributes={
-            "service.name": "jRetireWise"
-        })
-        logger_provider = LoggerProvider(resource=resource)
+        logger_provider = LoggerProvider(resource=_get_resource())
         set_logger_provider(logger_provider)
 
         # define the exporter to send logs to the observability backend 
-        log_exporter = OTLPLogExporter(endpoint=otlp_export_endpoint)
+        log_exporter = OTLPLogExporter(
+            endpoint=otlp_export_endpoint,
+            channel_options=_GRPC_CHANNEL_OPTIONS,
+            compression=Compression.Gzip,
+        )
         # register it with the global provider
         logger_provider.add_log_record_processor(
-            BatchLogRecordProcessor(log_exporter)
+            BatchLogRecordProcessor(
+                log_exporter,
+                max_queue_size=int(os.environ.get("OTEL_BLRP_MAX_QUEUE_SIZE", 4096)),
+                schedule_delay_millis=int(os.environ.get("OTEL_BLRP_SCHEDULE_DELAY", 1000)),
+                max_export_batch_size=int(os.environ.get("OTEL_BLRP_MAX_EXPORT_BATCH_SIZE", 256)),
+                export_timeout_millis=int(os.environ.get("OTEL_BLRP_EXPORT_TIMEOUT", 10000)),
+            )
         )
 
-    # configure the python logging module to support OTel by registering the handler
-    handler = LoggingHandler(level="INFO", logger_provider=logger_provider)
-    logger.addHandler(handler)
+        # console output is for local debugging only; keep it off the production path
+        if os.environ.get("OTEL_CONSOLE_EXPORTER", "false").lower() == "true":
+            logger_provider.add_log_record_processor(
+                BatchLogRecordProcessor(ConsoleLogExporter())
+            )
+
+    # configure the python logging module to support OTel by registering the handler,
+    # unless one is already attached (every extra handler exports each record again)
+    if not any(isinstance(h, LoggingHandler) for h in logger.handlers):
+        handler = LoggingHandler(level="INFO", logger_provider=logger_provider)
+        logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
-    # inject trace context into logs
-    LoggingInstrumentor().instrument(set_logging_format=True)
+    # inject trace context into log records (opentelemetry-instrument may have done this already).
+    # The root log format is left alone: records exported via LoggingHandler already carry
+    # trace/span ids, so rewriting every console line with them is redundant formatting work.
+    enabled = set(os.environ.get("OTEL_INSTRUMENTORS", "logging").split(","))
+    if "logging" in enabled:
+        try:
+            from opentelemetry.instrumentation.logging import LoggingInstrumentor
+
+            instrumentor = LoggingInstrumentor()
+            if not instrumentor.is_instrumented_by_opentelemetry:
+                instrumentor.instrument(set_logging_format=False)
+        except Exception as e:
+            logger.warning(f"Failed to instrument logging: {e}")
 
+    _otel_initialized = True
     logger.info("OpenTelemetry logging is configured.")
@@ -2,7 +2,6 @@
 Django settings for jRetireWise project.
 """
 
-import os
 from pathlib import Path
 import environ
 
@@ -14,7 +13,7 @@ env = environ.Env(
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
-environ.Env.read_env(os.path.join(BASE_DIR, '.env'))
+environ.Env.read_env(BASE_DIR / '.env')
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = env('SECRET_KEY', default='django-insecure-dev-key-change-in-production')
@@ -31,10 +30,9 @@ ALLOWED_HOSTS = [
     '127.0.0.1',
     # Optional: accept everything behind Cloudflare (safe for homelab)
     '*',
+    # Django test client
+    'testserver',
 ]
-# Add testserver for Django test client
-if 'testserver' not in ALLOWED_HOSTS:
-    ALLOWED_HOSTS = list(ALLOWED_HOSTS) + ['testserver']
 
 # Application definition
 INSTALLED_APPS = [
@@ -86,7 +84,7 @@ ROOT_URLCONF = 'config.urls'
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [os.path.join(BASE_DIR, 'jretirewise', 'templates')],
+        'DIRS': [BASE_DIR / 'jretirewise' / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -137,8 +135,8 @@ USE_TZ = True
 
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = '/static/'
-STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
-STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_DIRS = [BASE_DIR / 'static']
 STATICFILES_STORAGE = 'whitenoise.storage.StaticFilesStorage'
 
 # WhiteNoise Configuration
@@ -147,7 +145,7 @@ WHITENOISE_USE_FINDERS = True
 
 # Media files
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+MEDIA_ROOT = BASE_DIR / 'media'
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -180,9 +178,17 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0.0',
     'SERVE_PERMISSIONS': ['rest_framework.permissions.AllowAny'],
 }
+# Schema/Swagger/Redoc endpoints are only routed in development unless explicitly enabled
+ENABLE_API_DOCS = env.bool('ENABLE_API_DOCS', default=DEBUG)
 
 # CORS Configuration
-CORS_ALLOWED_ORIGINS = env('CORS_ALLOWED_ORIGINS', default='http://localhost:3000,http://localhost:8000').split(',')
+# env.list() splits on commas but keeps surrounding whitespace, which breaks origin matching
+CORS_ALLOWED_ORIGINS = [
+    origin.strip() for origin in env.list(
+        'CORS_ALLOWED_ORIGINS',
+        default=['http://localhost:3000', 'http://localhost:8000'],
+    )
+]
 
 # Authentication
 AUTHENTICATION_BACKENDS = [
@@ -229,7 +235,12 @@ LOGIN_REDIRECT_URL = '/'
 ACCOUNT_LOGOUT_REDIRECT_URL = '/'
 
 # CSRF Configuration
-CSRF_TRUSTED_ORIGINS = env('CSRF_TRUSTED_ORIGINS', default='http://localhost:8000,https://jretirewise.jaycurtis.org').split(',')
+CSRF_TRUSTED_ORIGINS = [
+    origin.strip() for origin in env.list(
+        'CSRF_TRUSTED_ORIGINS',
+        default=['http://localhost:8000', 'https://jretirewise.jaycurtis.org'],
+    )
+]
 CSRF_COOKIE_DOMAIN = env('CSRF_COOKIE_DOMAIN', default=None)
 CSRF_COOKIE_SAMESITE = 'Lax'  # Allow cross-site requests with cookies
 # Allow HTTP access via IP if ALLOW_INSECURE_CSRF_OVER_HTTP environment variable is set
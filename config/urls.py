@@ -6,7 +6,8 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_page
 from rest_framework.routers import DefaultRouter
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 from jretirewise.authentication.views import LoginView, LogoutView, UserProfileView
@@ -18,18 +19,30 @@ from jretirewise.scenarios.views import ScenarioViewSet, WithdrawalBucketViewSet
 from jretirewise.calculations.views import CalculationView
 
 
+# The generated OpenAPI schema only changes on deploy, so render it once per process
+SCHEMA_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 # Health check views
+# Probe bodies are constant, so encode them once. A fresh response is still built per
+# request because middleware mutates response headers/cookies in place.
+HEALTH_READY_BODY = b'{"status": "ready"}'
+HEALTH_LIVE_BODY = b'{"status": "alive"}'
+
+
 def health_ready(request):
     """Kubernetes readiness probe endpoint."""
-    return JsonResponse({'status': 'ready'})
+    return HttpResponse(HEALTH_READY_BODY, content_type='application/json')
 
 
 def health_live(request):
     """Kubernetes liveness probe endpoint."""
-    return JsonResponse({'status': 'alive'})
+    return HttpResponse(HEALTH_LIVE_BODY, content_type='application/json')
 
 # API Router
 router = DefaultRouter()
+# The API is JSON-only; skip the `.json`/`.api` suffix variant DRF adds for every route
+router.include_format_suffixes = False
 # Phase 1 endpoints
 router.register(r'assets', AssetViewSet, basename='asset')
 router.register(r'income-sources', IncomeSourceViewSet, basename='income-source')
@@ -58,11 +71,6 @@ urlpatterns = [
     path('api/v1/', include(router.urls)),
     path('api/v1/calculations/', CalculationView.as_view(), name='api-calculation'),
 
-    # API Schema
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
-
     # Template views
     path('', include('jretirewise.authentication.urls')),
     path('dashboard/', include('jretirewise.scenarios.urls')),
@@ -73,6 +81,14 @@ urlpatterns = [
     path('health/live/', health_live, name='health-live'),
 ]
 
+# API Schema
+if settings.ENABLE_API_DOCS:
+    urlpatterns += [
+        path('api/schema/', cache_page(SCHEMA_CACHE_TIMEOUT)(SpectacularAPIView.as_view()), name='schema'),
+        path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+        path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    ]
+
 # Serve media files in development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -2,13 +2,31 @@
 WSGI config for jRetireWise project.
 """
 
+import logging
 import os
+import threading
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-# Initialize OpenTelemetry before creating the WSGI application
-from config.otel import initialize_otel
-initialize_otel()
+logger = logging.getLogger(__name__)
+
+
+def _initialize_otel_in_background():
+    """Set up OpenTelemetry logging without holding up worker boot."""
+    try:
+        from config.otel import initialize_otel
+        initialize_otel()
+    except Exception as e:
+        # Don't fail if OpenTelemetry initialization fails
+        logger.warning('Failed to initialize OpenTelemetry: %s', e)
+
 
 application = get_wsgi_application()
+
+# Tracing and the Django instrumentor are set up by `opentelemetry-instrument` before this
+# module loads. The log pipeline (SDK imports, exporter/channel construction) is only needed
+# once the worker is serving, so build it off the boot path: a slow or unreachable collector
+# then can't delay the worker from accepting requests.
+if os.environ.get('OTEL_ENABLED', 'true').lower() == 'true':
+    threading.Thread(target=_initialize_otel_in_background, name='otel-init', daemon=True).start()
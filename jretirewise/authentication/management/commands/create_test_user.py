@@ -14,7 +14,9 @@ Environment variables (optional):
 
 import os
 from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 
 
 class Command(BaseCommand):
@@ -60,50 +62,51 @@ class Command(BaseCommand):
         username = email.split("@")[0]
 
         try:
-            # Check if user exists
-            user = User.objects.filter(email=email).first()
-
-            if user:
-                if options.get("force"):
-                    # Delete and recreate
-                    self.stdout.write(
-                        self.style.WARNING(f"Deleting existing user: {email}")
-                    )
-                    user.delete()
-                    user = None
-                else:
-                    # User exists, just update password
-                    self.stdout.write(
-                        self.style.WARNING(f"User already exists: {email}")
-                    )
-                    user.set_password(password)
-                    user.save()
-                    self.stdout.write(
-                        self.style.SUCCESS(f"Updated password for: {email}")
-                    )
-                    return
-
-            # Create new user
-            if not user:
-                user = User.objects.create_user(
-                    username=username,
-                    email=email,
-                    password=password,
-                    first_name="Smoke",
-                    last_name="Test",
-                    is_active=True
-                )
+            with transaction.atomic():
+                self._create_or_update(email, username, password, options.get("force"))
+        except Exception as e:
+            raise CommandError(f"Failed to create test user: {str(e)}")
 
+    def _create_or_update(self, email, username, password, force):
+        # Check if user exists (only the key is needed)
+        user = User.objects.filter(email=email).only("pk").first()
+
+        if user:
+            if force:
+                # Delete and recreate
+                self.stdout.write(
+                    self.style.WARNING(f"Deleting existing user: {email}")
+                )
+                user.delete()
+                user = None
+            else:
+                # User exists, just update password in a single UPDATE
                 self.stdout.write(
-                    self.style.SUCCESS(f"Created test user: {email}")
+                    self.style.WARNING(f"User already exists: {email}")
                 )
-                self.stdout.write(f"Username: {username}")
-                self.stdout.write(f"Password: {'*' * len(password)}")
+                User.objects.filter(pk=user.pk).update(password=make_password(password))
                 self.stdout.write(
-                    self.style.WARNING(
-                        "Note: Save these credentials securely (e.g., as GitHub Secrets)"
-                    )
+                    self.style.SUCCESS(f"Updated password for: {email}")
                 )
+                return
+
+        # Create new user
+        User.objects.create_user(
+            username=username,
+            email=email,
+            password=password,
+            first_name="Smoke",
+            last_name="Test",
+            is_active=True
+        )
 
-        except Exception as e:
-            raise CommandError(f"Failed to create test user: {str(e)}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Created test user: {email}")
+        )
+        self.stdout.write(f"Username: {username}")
+        self.stdout.write(f"Password: {'*' * len(password)}")
+        self.stdout.write(
+            self.style.WARNING(
+                "Note: Save these credentials securely (e.g., as GitHub Secrets)"
+            )
+        )
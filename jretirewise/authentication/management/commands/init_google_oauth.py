@@ -38,6 +38,16 @@ class Command(BaseCommand):
                 )
             )
 
+        # Every pod start runs this; when the app already has these credentials and is
+        # linked to the default site, one EXISTS query is all the work there is to do
+        if SocialApp.objects.filter(
+            provider='google', client_id=client_id, secret=client_secret, sites__pk=1
+        ).exists():
+            self.stdout.write(
+                self.style.SUCCESS('✓ Google OAuth SocialApp already configured')
+            )
+            return
+
         # Get or create Site
         site = Site.objects.get_or_create(
             pk=1,
@@ -73,8 +83,8 @@ class Command(BaseCommand):
                     self.style.SUCCESS(f'✓ Google OAuth SocialApp already configured')
                 )
 
-            # Ensure site is linked
-            if site not in app.sites.all():
+            # Ensure site is linked (indexed EXISTS instead of loading every linked site)
+            if not app.sites.filter(pk=site.pk).exists():
                 app.sites.add(site)
                 self.stdout.write(
                     self.style.SUCCESS(f'✓ Linked SocialApp to site: {site.domain}')
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-17 15:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='userprofile',
+            name='authenticat_google__79f571_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='userprofile',
+            name='authenticat_user_id_35f8a3_idx',
+        ),
+    ]
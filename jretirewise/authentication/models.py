@@ -27,10 +27,6 @@ class UserProfile(models.Model):
         db_table = 'authentication_userprofile'
         verbose_name = 'User Profile'
         verbose_name_plural = 'User Profiles'
-        indexes = [
-            models.Index(fields=['google_oauth_id']),
-            models.Index(fields=['user']),
-        ]
 
     def __str__(self):
         return f"Profile of {self.user.email}"
@@ -40,10 +36,4 @@ class UserProfile(models.Model):
 def create_user_profile(sender, instance, created, **kwargs):
     """Automatically create a UserProfile when a new User is created."""
     if created:
-        UserProfile.objects.get_or_create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Automatically save the UserProfile when a User is saved."""
-    instance.profile.save()
+        UserProfile.objects.create(user=instance)
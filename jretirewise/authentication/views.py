@@ -2,6 +2,7 @@
 Views for authentication.
 """
 
+import hashlib
 import logging
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -11,13 +12,17 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth.models import User
 from django.views.generic import TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponse
 from django.shortcuts import render, redirect
 from django.contrib.auth import logout as auth_logout
 from django.contrib import messages
-from django.views.decorators.http import require_http_methods
+from django.db import transaction
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_http_methods, etag
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from .models import UserProfile
-from .serializers import UserSerializer, UserProfileSerializer
+from .serializers import UserProfileSerializer
 from jretirewise.financial.models import FinancialProfile, TaxProfile
 from jretirewise.financial.forms import FinancialProfileForm
 from jretirewise.scenarios.models import RetirementScenario
@@ -25,6 +30,10 @@ from jretirewise.scenarios.models import RetirementScenario
 logger = logging.getLogger(__name__)
 
 
+# Constant body, encoded once; skips DRF content negotiation and rendering per request
+LOGIN_RESPONSE_BODY = b'{"status": "Use Google OAuth for login"}'
+
+
 class LoginView(APIView):
     """Handle user login."""
     permission_classes = [AllowAny]
@@ -32,7 +41,7 @@ class LoginView(APIView):
     def post(self, request):
         """Login endpoint."""
         # Login is handled by django-allauth
-        return Response({'status': 'Use Google OAuth for login'})
+        return HttpResponse(LOGIN_RESPONSE_BODY, content_type='application/json')
 
 
 class LogoutView(APIView):
@@ -51,14 +60,52 @@ class LogoutView(APIView):
         return Response({'status': 'logged out'})
 
 
+def user_profile_etag(request, *args, **kwargs):
+    """ETag for the profile payload: changes whenever the user or profile row changes."""
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    profile = getattr(user, 'profile', None)
+    updated_at = profile.updated_at.isoformat() if profile else ''
+    key = f'{user.pk}:{user.email}:{user.username}:{user.first_name}:{user.last_name}:{updated_at}'
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def user_profile_payload(user):
+    """
+    Build the UserSerializer payload directly from an already-loaded user.
+
+    Matches UserSerializer's output field for field without walking nested serializer
+    fields (the nested profile fields source back through profile.user).
+    """
+    profile = getattr(user, 'profile', None)
+    return {
+        'id': user.pk,
+        'email': user.email,
+        'username': user.username,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'profile': {
+            'email': user.email,
+            'username': user.username,
+            'full_name': profile.full_name,
+            'theme_preference': profile.theme_preference,
+            'notification_email': profile.notification_email,
+        } if profile else None,
+    }
+
+
 class UserProfileView(APIView):
     """Retrieve current user profile."""
     permission_classes = [IsAuthenticated]
 
+    # Clients revalidate on every poll; unchanged profiles get a 304 without re-serializing
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(etag(user_profile_etag))
     def get(self, request):
         """Get current user profile."""
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+        # The profile row was already loaded (and cached on the user) by the ETag check
+        return Response(user_profile_payload(request.user))
 
     def put(self, request):
         """Update current user profile."""
@@ -70,12 +117,17 @@ class UserProfileView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        # Save the validated data
-        serializer.save()
+        # Write only the submitted columns in one UPDATE instead of a full-row save().
+        # update() skips auto_now, so bump updated_at explicitly (the ETag depends on it).
+        changes = dict(serializer.validated_data, updated_at=timezone.now())
+        UserProfile.objects.filter(pk=profile.pk).update(**changes)
+
+        # Mirror the write onto the cached profile so the response needs no re-fetch
+        for field, value in changes.items():
+            setattr(profile, field, value)
 
         # Return updated user data
-        user_serializer = UserSerializer(user)
-        return Response(user_serializer.data)
+        return Response(user_profile_payload(user))
 
 
 class DashboardView(LoginRequiredMixin, TemplateView):
@@ -86,22 +138,31 @@ class DashboardView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         """Add context data for dashboard."""
         context = super().get_context_data(**kwargs)
-        user = self.request.user
-        try:
-            context['financial_profile'] = FinancialProfile.objects.get(user=user)
-        except FinancialProfile.DoesNotExist:
-            context['financial_profile'] = None
-
-        # Get portfolio if it exists
-        try:
-            context['portfolio'] = user.portfolio
-        except:
-            context['portfolio'] = None
-
-        context['scenarios'] = RetirementScenario.objects.filter(user=user).order_by('-updated_at')[:5]
+        # Load both one-to-one relations in a single query; a missing one resolves to None
+        user = User.objects.select_related('financial_profile', 'portfolio').get(pk=self.request.user.pk)
+        context['financial_profile'] = getattr(user, 'financial_profile', None)
+        context['portfolio'] = getattr(user, 'portfolio', None)
+
+        # The template shows each scenario's result status, so join it in up front
+        context['scenarios'] = (
+            RetirementScenario.objects.filter(user=user)
+            .select_related('result')
+            .order_by('-updated_at')[:5]
+        )
         return context
 
 
+# Tax profile fields edited through the unified profile form
+TAX_PROFILE_FORM_FIELDS = (
+    'filing_status',
+    'state_of_residence',
+    'social_security_age_62',
+    'social_security_age_65',
+    'social_security_age_67',
+    'social_security_age_70',
+)
+
+
 class ProfileView(LoginRequiredMixin, TemplateView):
     """User profile template view."""
     template_name = 'jretirewise/profile.html'
@@ -112,75 +173,49 @@ class ProfileView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         user = self.request.user
 
-        # Get or create financial profile
-        try:
-            profile = FinancialProfile.objects.get(user=user)
-            context['financial_profile'] = profile
-        except FinancialProfile.DoesNotExist:
-            context['financial_profile'] = None
+        # One query loads the profile along with the user and tax profile the form reads
+        profile = FinancialProfile.objects.select_related('user__tax_profile').filter(user=user).first()
+        context['financial_profile'] = profile
 
         # Initialize unified form
         if 'form' not in context:
-            try:
-                profile = FinancialProfile.objects.get(user=user)
-                context['form'] = FinancialProfileForm(instance=profile)
-            except FinancialProfile.DoesNotExist:
-                context['form'] = FinancialProfileForm()
+            context['form'] = FinancialProfileForm(instance=profile)
 
         return context
 
     def post(self, request, *args, **kwargs):
         """Handle unified profile form submission."""
-        user = request.user
-
-        # Get or create financial profile
-        try:
-            profile = FinancialProfile.objects.get(user=user)
-        except FinancialProfile.DoesNotExist:
-            profile = None
+        # Load both profiles with the user in one query; a missing one resolves to None.
+        # The join also caches profile.user and user.tax_profile for the form's initial data.
+        user = User.objects.select_related('financial_profile', 'tax_profile').get(pk=request.user.pk)
+        profile = getattr(user, 'financial_profile', None)
 
         # Process unified form
         form = FinancialProfileForm(request.POST, instance=profile)
 
         if form.is_valid():
-            # Save financial profile
-            profile = form.save(commit=False)
-            profile.user = user
-            profile.save()
-
-            # Get or create and save tax profile (only filing_status and state)
-            try:
-                tax_profile = TaxProfile.objects.get(user=user)
-            except TaxProfile.DoesNotExist:
-                tax_profile = TaxProfile(user=user)
-
-            # Update tax profile with form data (use form values if present)
-            filing_status = form.cleaned_data.get('filing_status')
-            if filing_status:
-                tax_profile.filing_status = filing_status
-
-            state = form.cleaned_data.get('state_of_residence')
-            if state:
-                tax_profile.state_of_residence = state
-
-            # Update Social Security benefit amounts
-            ss_age_62 = form.cleaned_data.get('social_security_age_62')
-            if ss_age_62 is not None:
-                tax_profile.social_security_age_62 = ss_age_62
-
-            ss_age_65 = form.cleaned_data.get('social_security_age_65')
-            if ss_age_65 is not None:
-                tax_profile.social_security_age_65 = ss_age_65
-
-            ss_age_67 = form.cleaned_data.get('social_security_age_67')
-            if ss_age_67 is not None:
-                tax_profile.social_security_age_67 = ss_age_67
-
-            ss_age_70 = form.cleaned_data.get('social_security_age_70')
-            if ss_age_70 is not None:
-                tax_profile.social_security_age_70 = ss_age_70
-
-            tax_profile.save()
+            # Get or create tax profile (only filing_status, state and Social Security)
+            tax_profile = getattr(user, 'tax_profile', None) or TaxProfile(user=user)
+
+            # Update tax profile with form data (use form values if present); a blank
+            # filing status or state keeps the stored value, while 0 is a real SS amount
+            tax_updates = {
+                field: form.cleaned_data.get(field) for field in TAX_PROFILE_FORM_FIELDS
+                if form.cleaned_data.get(field) not in (None, '')
+            }
+            for field, value in tax_updates.items():
+                setattr(tax_profile, field, value)
+
+            # Both rows commit together, and an existing tax profile only writes what changed
+            with transaction.atomic():
+                profile = form.save(commit=False)
+                profile.user = user
+                profile.save()
+
+                if tax_profile.pk:
+                    tax_profile.save(update_fields=[*tax_updates, 'updated_at'])
+                else:
+                    tax_profile.save()
 
             messages.success(request, 'Profile updated successfully!')
             return redirect('financial-profile')
@@ -198,6 +233,5 @@ class ProfileView(LoginRequiredMixin, TemplateView):
             error_message = "Profile update failed. Errors: " + "; ".join(error_details) if error_details else "Profile update failed with unknown errors."
             messages.error(request, error_message)
 
-            context = self.get_context_data()
-            context['form'] = form
+            context = self.get_context_data(form=form)
             return render(request, self.template_name, context)
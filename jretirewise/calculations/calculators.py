@@ -2,26 +2,19 @@
 Financial calculation engines for retirement planning.
 """
 
+import copy
 import logging
-from dataclasses import dataclass
+import math
+from functools import lru_cache
 from typing import Dict, List
 from decimal import Decimal
 import numpy as np
+from scipy.signal import lfilter
+from jretirewise.calculations.kernels import simulate_gbm_withdrawals, simulate_withdrawals
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class YearProjection:
-    """Projection for a single year."""
-    year: int
-    age: int
-    portfolio_value: Decimal
-    annual_withdrawal: Decimal
-    investment_return: Decimal
-    ending_balance: Decimal
-
-
 class RetirementCalculator:
     """Base class for retirement calculators."""
 
@@ -59,183 +52,117 @@ class RetirementCalculator:
         """Calculate and return retirement projection."""
         raise NotImplementedError
 
-
-class FourPercentCalculator(RetirementCalculator):
-    """4% rule calculator - withdraw 4% of initial portfolio."""
-
-    def calculate(self) -> Dict:
+    def _project(self, withdrawal_rate: float) -> Dict[str, np.ndarray]:
         """
-        Calculate using 4% rule.
+        Project a fixed-rate withdrawal plan year by year.
 
-        Returns:
-            Dictionary with projection data and success metrics
+        The first withdrawal is withdrawal_rate of the starting portfolio and grows
+        with inflation each year. Runs in float64 and returns one array per
+        projection column, indexed by year of retirement.
         """
-        projections = []
-        current_portfolio = self.portfolio_value
-
-        # Initial 4% withdrawal
-        initial_withdrawal = self.portfolio_value * Decimal('0.04')
-
         years_in_retirement = self.life_expectancy - self.retirement_age
+        years = np.arange(years_in_retirement + 1)
+        annual_return_rate = float(self.annual_return_rate)
+
+        # Whole withdrawal schedule at once: initial withdrawal * (1 + inflation) ** year
+        initial_withdrawal = float(self.portfolio_value) * withdrawal_rate
+        withdrawals = initial_withdrawal * (1 + float(self.inflation_rate)) ** years
+
+        # Until the portfolio runs out, ending[n] = growth * ending[n - 1] - withdrawals[n], a
+        # first-order linear recurrence that lfilter evaluates in one pass (ending[-1] = start)
+        starting_value = float(self.portfolio_value)
+        growth = 1 + annual_return_rate
+        ending_balance = lfilter([1.0], [1.0, -growth], -withdrawals, zi=[growth * starting_value])[0]
+
+        portfolio_start = np.empty(years_in_retirement + 1)
+        portfolio_start[0] = starting_value
+        portfolio_start[1:] = ending_balance[:-1]
+
+        # A negative balance is floored at zero, so every later year starts empty and
+        # ends at minus that year's withdrawal
+        depleted = np.flatnonzero(ending_balance < 0)
+        if depleted.size:
+            first_after = depleted[0] + 1
+            portfolio_start[first_after:] = 0.0
+            ending_balance[first_after:] = 0.0 - withdrawals[first_after:]
 
-        for year in range(years_in_retirement + 1):
-            age = self.retirement_age + year
-
-            if year == 0:
-                # First year of retirement
-                withdrawal = initial_withdrawal
-                portfolio_start = self.portfolio_value
-            else:
-                # Withdrawal increases with inflation
-                withdrawal = initial_withdrawal * ((Decimal(1) + self.inflation_rate) ** year)
-                portfolio_start = current_portfolio
+        return {
+            'year': years,
+            'age': self.retirement_age + years,
+            'portfolio_value': portfolio_start,
+            'annual_withdrawal': withdrawals,
+            'investment_return': portfolio_start * annual_return_rate,
+            'ending_balance': ending_balance,
+        }
 
-            # Investment return
-            investment_return = portfolio_start * self.annual_return_rate
+    def _run_fixed_rate_projection(self, withdrawal_rate: float, calculator_type: str) -> Dict:
+        """
+        Run a fixed-rate withdrawal plan and build the result dictionary.
 
-            # Ending balance
-            ending_balance = portfolio_start + investment_return - withdrawal
-            current_portfolio = max(Decimal(0), ending_balance)
-
-            projections.append(YearProjection(
-                year=year,
-                age=age,
-                portfolio_value=portfolio_start,
-                annual_withdrawal=withdrawal,
-                investment_return=investment_return,
-                ending_balance=ending_balance,
-            ))
+        Shared by the 4% and 4.7% rule calculators, which differ only in the rate.
+        """
+        # Initial withdrawal at withdrawal_rate, growing with inflation
+        columns = self._project(withdrawal_rate)
+        projections = self._projections_to_dicts(columns)
+        ending_balances = columns['ending_balance']
 
         # Calculate success metrics
-        success_rate = self._calculate_success_rate(projections)
-        portfolio_depleted_year = self._find_depletion_year(projections)
+        success_rate = self._calculate_success_rate(ending_balances)
+        portfolio_depleted_year = self._find_depletion_year(ending_balances)
 
         return {
-            'calculator_type': '4_percent_rule',
+            'calculator_type': calculator_type,
             'success_rate': success_rate,
             'portfolio_depleted_year': portfolio_depleted_year,
             'portfolio_depleted_age': self.retirement_age + portfolio_depleted_year if portfolio_depleted_year else None,
-            'projections': [self._projection_to_dict(p) for p in projections],
-            'final_portfolio_value': float(projections[-1].ending_balance),
-            'total_withdrawals': sum(float(p.annual_withdrawal) for p in projections),
+            'projections': projections,
+            'final_portfolio_value': float(ending_balances[-1]),
+            'total_withdrawals': float(columns['annual_withdrawal'].sum()),
             'social_security_annual': float(self.social_security_annual),
             'claiming_age': self.social_security_claiming_age,
         }
 
-    def _calculate_success_rate(self, projections: List[YearProjection]) -> float:
+    def _calculate_success_rate(self, ending_balances: np.ndarray) -> float:
         """Calculate success rate (portfolio never depleted)."""
-        for projection in projections:
-            if projection.ending_balance < 0:
-                return 0.0
-        return 100.0
+        return 0.0 if (ending_balances < 0).any() else 100.0
 
-    def _find_depletion_year(self, projections: List[YearProjection]) -> int:
+    def _find_depletion_year(self, ending_balances: np.ndarray) -> int:
         """Find year when portfolio is depleted."""
-        for projection in projections:
-            if projection.ending_balance <= 0:
-                return projection.year
-        return None
+        depleted = ending_balances <= 0
+        return int(np.argmax(depleted)) if depleted.any() else None
 
     @staticmethod
-    def _projection_to_dict(projection: YearProjection) -> Dict:
-        """Convert projection to dictionary."""
-        return {
-            'year': projection.year,
-            'age': projection.age,
-            'portfolio_value': float(projection.portfolio_value),
-            'annual_withdrawal': float(projection.annual_withdrawal),
-            'investment_return': float(projection.investment_return),
-            'ending_balance': float(projection.ending_balance),
-        }
+    def _projections_to_dicts(columns: Dict[str, np.ndarray]) -> List[Dict]:
+        """Convert projection columns to one dictionary per year."""
+        keys = list(columns)
+        rows = zip(*(column.tolist() for column in columns.values()))
+        return [dict(zip(keys, row)) for row in rows]
 
 
-class FourPointSevenPercentCalculator(RetirementCalculator):
-    """4.7% rule calculator - slightly more aggressive than 4% rule."""
+class FourPercentCalculator(RetirementCalculator):
+    """4% rule calculator - withdraw 4% of initial portfolio."""
 
     def calculate(self) -> Dict:
         """
-        Calculate using 4.7% rule.
+        Calculate using 4% rule.
 
         Returns:
             Dictionary with projection data and success metrics
         """
-        projections = []
-        current_portfolio = self.portfolio_value
-
-        # Initial 4.7% withdrawal
-        initial_withdrawal = self.portfolio_value * Decimal('0.047')
-
-        years_in_retirement = self.life_expectancy - self.retirement_age
-
-        for year in range(years_in_retirement + 1):
-            age = self.retirement_age + year
-
-            if year == 0:
-                # First year of retirement
-                withdrawal = initial_withdrawal
-                portfolio_start = self.portfolio_value
-            else:
-                # Withdrawal increases with inflation
-                withdrawal = initial_withdrawal * ((Decimal(1) + self.inflation_rate) ** year)
-                portfolio_start = current_portfolio
-
-            # Investment return
-            investment_return = portfolio_start * self.annual_return_rate
-
-            # Ending balance
-            ending_balance = portfolio_start + investment_return - withdrawal
-            current_portfolio = max(Decimal(0), ending_balance)
-
-            projections.append(YearProjection(
-                year=year,
-                age=age,
-                portfolio_value=portfolio_start,
-                annual_withdrawal=withdrawal,
-                investment_return=investment_return,
-                ending_balance=ending_balance,
-            ))
+        return self._run_fixed_rate_projection(0.04, '4_percent_rule')
 
-        # Calculate success metrics
-        success_rate = self._calculate_success_rate(projections)
-        portfolio_depleted_year = self._find_depletion_year(projections)
-
-        return {
-            'calculator_type': '4_7_percent_rule',
-            'success_rate': success_rate,
-            'portfolio_depleted_year': portfolio_depleted_year,
-            'portfolio_depleted_age': self.retirement_age + portfolio_depleted_year if portfolio_depleted_year else None,
-            'projections': [self._projection_to_dict(p) for p in projections],
-            'final_portfolio_value': float(projections[-1].ending_balance),
-            'total_withdrawals': sum(float(p.annual_withdrawal) for p in projections),
-            'social_security_annual': float(self.social_security_annual),
-            'claiming_age': self.social_security_claiming_age,
-        }
 
-    def _calculate_success_rate(self, projections: List[YearProjection]) -> float:
-        """Calculate success rate (portfolio never depleted)."""
-        for projection in projections:
-            if projection.ending_balance < 0:
-                return 0.0
-        return 100.0
+class FourPointSevenPercentCalculator(RetirementCalculator):
+    """4.7% rule calculator - slightly more aggressive than 4% rule."""
 
-    def _find_depletion_year(self, projections: List[YearProjection]) -> int:
-        """Find year when portfolio is depleted."""
-        for projection in projections:
-            if projection.ending_balance <= 0:
-                return projection.year
-        return None
+    def calculate(self) -> Dict:
+        """
+        Calculate using 4.7% rule.
 
-    @staticmethod
-    def _projection_to_dict(projection: YearProjection) -> Dict:
-        """Convert projection to dictionary."""
-        return {
-            'year': projection.year,
-            'age': projection.age,
-            'portfolio_value': float(projection.portfolio_value),
-            'annual_withdrawal': float(projection.annual_withdrawal),
-            'investment_return': float(projection.investment_return),
-            'ending_balance': float(projection.ending_balance),
-        }
+        Returns:
+            Dictionary with projection data and success metrics
+        """
+        return self._run_fixed_rate_projection(0.047, '4_7_percent_rule')
 
 
 class MonteCarloCalculator(RetirementCalculator):
@@ -249,7 +176,8 @@ class MonteCarloCalculator(RetirementCalculator):
     def __init__(self, portfolio_value, annual_spending,
                  current_age: int, retirement_age: int, life_expectancy: int,
                  annual_return_rate: float = 0.07, inflation_rate: float = 0.03,
-                 return_std_dev: float = 0.15, num_simulations: int = 1000):
+                 return_std_dev: float = 0.15, num_simulations: int = 1000,
+                 seed: int = None):
         """
         Initialize Monte Carlo calculator.
 
@@ -263,20 +191,40 @@ class MonteCarloCalculator(RetirementCalculator):
             inflation_rate: Expected inflation rate
             return_std_dev: Standard deviation of returns (volatility)
             num_simulations: Number of Monte Carlo simulations to run
+            seed: Optional random seed for reproducible simulations
         """
         super().__init__(portfolio_value, annual_spending, current_age,
                          retirement_age, life_expectancy, annual_return_rate,
                          inflation_rate)
         self.return_std_dev = float(return_std_dev)
         self.num_simulations = int(num_simulations)
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
 
     def calculate(self) -> Dict:
         """
         Run Monte Carlo simulation.
 
+        Seeded runs are deterministic, so their results are memoized per process;
+        callers get a copy they are free to modify.
+
         Returns:
             Dictionary with simulation results, percentiles, and success metrics
         """
+        if self.seed is None:
+            return self._simulate()
+        return copy.deepcopy(_cached_monte_carlo(self._cache_key()))
+
+    def _cache_key(self) -> tuple:
+        """Constructor arguments that fully determine a seeded run, in signature order."""
+        return (
+            self.portfolio_value, self.annual_spending, self.current_age,
+            self.retirement_age, self.life_expectancy, self.annual_return_rate,
+            self.inflation_rate, self.return_std_dev, self.num_simulations, self.seed,
+        )
+
+    def _simulate(self) -> Dict:
+        """Run the simulations and summarize them."""
         years_in_retirement = self.life_expectancy - self.retirement_age
 
         # Use numpy for efficient simulation
@@ -284,91 +232,55 @@ class MonteCarloCalculator(RetirementCalculator):
         inflation = float(self.inflation_rate)
         initial_withdrawal = float(self.portfolio_value) * 0.04  # 4% initial withdrawal
 
-        # Run all simulations
-        all_simulations = []
-        successful_simulations = 0
-
-        for sim in range(self.num_simulations):
-            portfolio = float(self.portfolio_value)
-            withdrawal = initial_withdrawal
-            yearly_values = [portfolio]
-            depleted_year = None
-
-            for year in range(1, years_in_retirement + 1):
-                # Random return from normal distribution
-                annual_return = np.random.normal(mean_return, self.return_std_dev)
-
-                # Apply return
-                portfolio = portfolio * (1 + annual_return)
+        # Run all simulations at once: one row per year, one column per simulation
+        z = self._rng.standard_normal((years_in_retirement, self.num_simulations))
+        returns = mean_return + self.return_std_dev * z
+        # Withdrawal grows with inflation before each year's withdrawal
+        withdrawals = initial_withdrawal * (1 + inflation) ** np.arange(1, years_in_retirement + 1)
 
-                # Adjust withdrawal for inflation
-                withdrawal = withdrawal * (1 + inflation)
+        # Apply return, make withdrawal, floor depleted portfolios at zero (JIT-compiled
+        # when Numba is installed)
+        yearly_values = simulate_withdrawals(float(self.portfolio_value), returns, withdrawals)
 
-                # Make withdrawal
-                portfolio = portfolio - withdrawal
-
-                # Track if depleted
-                if portfolio <= 0:
-                    portfolio = 0
-                    if depleted_year is None:
-                        depleted_year = year
-
-                yearly_values.append(portfolio)
-
-            # Track success (portfolio never depleted)
-            if depleted_year is None:
-                successful_simulations += 1
-
-            all_simulations.append({
-                'yearly_values': yearly_values,
-                'final_value': portfolio,
-                'depleted_year': depleted_year,
-                'success': depleted_year is None
-            })
+        # Track depletion (first year the portfolio hits zero); success means never depleted.
+        # A depleted portfolio stays at zero, so the first depleted year follows from the count.
+        depleted_counts = (yearly_values[1:] <= 0).sum(axis=0)
+        ever_depleted = depleted_counts > 0
+        depletion_years = years_in_retirement - depleted_counts[ever_depleted] + 1
+        successful_simulations = int(self.num_simulations - ever_depleted.sum())
 
         # Calculate success rate
         success_rate = (successful_simulations / self.num_simulations) * 100
 
-        # Calculate percentiles for final portfolio values
-        final_values = [sim['final_value'] for sim in all_simulations]
-        percentiles = {
-            'p5': float(np.percentile(final_values, 5)),
-            'p10': float(np.percentile(final_values, 10)),
-            'p25': float(np.percentile(final_values, 25)),
-            'p50': float(np.percentile(final_values, 50)),  # Median
-            'p75': float(np.percentile(final_values, 75)),
-            'p90': float(np.percentile(final_values, 90)),
-            'p95': float(np.percentile(final_values, 95)),
-        }
+        # Percentiles for every year in one pass over the (years x simulations) array;
+        # the last row doubles as the final portfolio value percentiles
+        percentile_keys = ('p5', 'p10', 'p25', 'p50', 'p75', 'p90', 'p95')
+        yearly_pcts = np.percentile(yearly_values, [5, 10, 25, 50, 75, 90, 95], axis=1).T.tolist()
+        yearly_means = yearly_values.mean(axis=1).tolist()
+
+        # Calculate percentiles for final portfolio values (p50 is the median)
+        percentiles = dict(zip(percentile_keys, yearly_pcts[-1]))
 
         # Calculate year-by-year percentile projections for charting
-        yearly_percentiles = []
-        for year in range(years_in_retirement + 1):
-            year_values = [sim['yearly_values'][year] for sim in all_simulations]
-            yearly_percentiles.append({
+        yearly_percentiles = [
+            {
                 'year': year,
                 'age': self.retirement_age + year,
-                'p5': float(np.percentile(year_values, 5)),
-                'p10': float(np.percentile(year_values, 10)),
-                'p25': float(np.percentile(year_values, 25)),
-                'p50': float(np.percentile(year_values, 50)),
-                'p75': float(np.percentile(year_values, 75)),
-                'p90': float(np.percentile(year_values, 90)),
-                'p95': float(np.percentile(year_values, 95)),
-                'mean': float(np.mean(year_values)),
-            })
+                **dict(zip(percentile_keys, pcts)),
+                'mean': mean,
+            }
+            for year, (pcts, mean) in enumerate(zip(yearly_pcts, yearly_means))
+        ]
 
         # Find depletion statistics
-        depleted_sims = [sim for sim in all_simulations if sim['depleted_year'] is not None]
         depletion_stats = None
-        if depleted_sims:
-            depletion_years = [sim['depleted_year'] for sim in depleted_sims]
+        if depletion_years.size:
             depletion_stats = {
-                'count': len(depleted_sims),
-                'earliest_year': min(depletion_years),
-                'latest_year': max(depletion_years),
+                'count': int(depletion_years.size),
+                'earliest_year': int(depletion_years.min()),
+                'latest_year': int(depletion_years.max()),
                 'median_year': float(np.median(depletion_years)),
-                'earliest_age': self.retirement_age + min(depletion_years),
+                'earliest_age': self.retirement_age + int(depletion_years.min()),
                 'median_age': self.retirement_age + int(np.median(depletion_years)),
             }
 
@@ -397,6 +309,12 @@ class MonteCarloCalculator(RetirementCalculator):
         }
 
 
+@lru_cache(maxsize=128)
+def _cached_monte_carlo(cache_key: tuple) -> Dict:
+    """Memoized seeded Monte Carlo run; treat the returned dict as read-only."""
+    return MonteCarloCalculator(*cache_key)._simulate()
+
+
 class DynamicBucketedWithdrawalCalculator:
     """
     Advanced calculator for dynamic bucketed withdrawal rate scenarios.
@@ -427,53 +345,61 @@ class DynamicBucketedWithdrawalCalculator:
             Dictionary with year-by-year projections and summary statistics
         """
         projections = []
-        current_portfolio = self.portfolio_value
+        total_withdrawal = 0.0
+        # Projections are approximate and reported as floats, so run the loop in float64
+        current_portfolio = float(self.portfolio_value)
+        annual_return_rate = float(self.annual_return_rate)
         years_in_retirement = self.life_expectancy - self.retirement_age
 
+        bucket_schedule = self._build_bucket_schedule(
+            self._prepare_buckets(buckets), years_in_retirement
+        )
+
         for year in range(years_in_retirement + 1):
             age = self.retirement_age + year
-            bucket = self._find_applicable_bucket(age, year, buckets)
+            bucket = bucket_schedule[year]
 
             if not bucket:
                 break  # No applicable bucket for this age
 
             # Calculate withdrawal for this year
-            withdrawal_data = self._calculate_year_withdrawal(
-                current_portfolio, age, bucket, year
+            withdrawal_data = self._withdrawal_for_prepared_bucket(
+                current_portfolio, age, bucket
             )
 
             # Investment return
             portfolio_value_start = current_portfolio
-            investment_growth = portfolio_value_start * self.annual_return_rate
+            investment_growth = portfolio_value_start * annual_return_rate
             actual_withdrawal = withdrawal_data['actual_withdrawal']
 
             # Ending balance
             ending_balance = portfolio_value_start + investment_growth - actual_withdrawal
-            ending_balance = max(Decimal(0), ending_balance)
+            ending_balance = max(0.0, ending_balance)
 
             # Build projection record
             projection = {
                 'year': year,
                 'age': age,
-                'bucket_name': bucket.get('bucket_name', 'Unknown'),
-                'target_rate': bucket.get('target_withdrawal_rate', 0),
-                'calculated_withdrawal': float(withdrawal_data['calculated_withdrawal']),
-                'actual_withdrawal': float(actual_withdrawal),
-                'portfolio_value_start': float(portfolio_value_start),
-                'investment_growth': float(investment_growth),
-                'portfolio_value_end': float(ending_balance),
-                'pension_income': float(withdrawal_data.get('pension_income', 0)),
-                'social_security_income': float(withdrawal_data.get('social_security_income', 0)),
-                'total_available_income': float(
+                'bucket_name': bucket['bucket_name'],
+                'target_rate': bucket['target_rate'],
+                'calculated_withdrawal': withdrawal_data['calculated_withdrawal'],
+                'actual_withdrawal': actual_withdrawal,
+                'portfolio_value_start': portfolio_value_start,
+                'investment_growth': investment_growth,
+                'portfolio_value_end': ending_balance,
+                'pension_income': withdrawal_data['pension_income'],
+                'social_security_income': withdrawal_data['social_security_income'],
+                'total_available_income': (
                     actual_withdrawal +
-                    withdrawal_data.get('pension_income', 0) +
-                    withdrawal_data.get('social_security_income', 0)
+                    withdrawal_data['pension_income'] +
+                    withdrawal_data['social_security_income']
                 ),
                 'notes': withdrawal_data.get('notes', ''),
                 'flags': withdrawal_data.get('flags', []),
             }
 
             projections.append(projection)
+            total_withdrawal += actual_withdrawal
             current_portfolio = ending_balance
 
             # Stop if portfolio depleted
@@ -481,7 +407,7 @@ class DynamicBucketedWithdrawalCalculator:
                 break
 
         # Calculate summary statistics
-        summary = self._calculate_summary(projections)
+        summary = self._calculate_summary(projections, total_withdrawal)
 
         return {
             'calculator_type': 'bucketed_withdrawal',
@@ -489,6 +415,29 @@ class DynamicBucketedWithdrawalCalculator:
             'summary': summary,
         }
 
+    def _build_bucket_schedule(self, buckets: List[Dict], years_in_retirement: int) -> List[Dict]:
+        """
+        Map each year of retirement to its bucket (None where no bucket applies).
+
+        Same matching rules as _find_applicable_bucket, including first match wins:
+        buckets are laid down in reverse so earlier ones overwrite later ones.
+        """
+        schedule = [None] * (years_in_retirement + 1)
+        for bucket in reversed(buckets):
+            start_age = bucket.get('start_age')
+            if start_age is None:
+                continue
+            end_age = bucket.get('end_age')
+
+            first_year = max(0, math.floor(float(start_age)) - self.retirement_age)
+            last_year = years_in_retirement
+            if end_age is not None:
+                last_year = min(last_year, math.floor(float(end_age)) - self.retirement_age)
+
+            for year in range(first_year, last_year + 1):
+                schedule[year] = bucket
+        return schedule
+
     def _find_applicable_bucket(self, age: int, year: int, buckets: List[Dict]) -> Dict:
         """Find the bucket that applies for the given age/year.
 
@@ -496,7 +445,6 @@ class DynamicBucketedWithdrawalCalculator:
         - A bucket with start_age=57.5 will match integer age 57 (floor(57.5)=57)
         - A bucket with end_age=59.5 will match integer ages up to 59 (floor(59.5)=59)
         """
-        import math
         for bucket in buckets:
             # Check age range
             start_age = bucket.get('start_age')
@@ -513,55 +461,92 @@ class DynamicBucketedWithdrawalCalculator:
 
         return None
 
-    def _calculate_year_withdrawal(self, portfolio_value: Decimal, age: int,
+    @staticmethod
+    def _prepare_buckets(buckets: List[Dict]) -> List[Dict]:
+        """
+        Convert each bucket's numeric settings to floats once, ahead of the yearly loop.
+
+        start_age/end_age are kept as given so bucket matching is unchanged.
+        """
+        prepared = []
+        for bucket in buckets:
+            manual_override = bucket.get('manual_withdrawal_override')
+            prepared_bucket = {
+                'bucket_name': bucket.get('bucket_name', 'Unknown'),
+                'target_rate': bucket.get('target_withdrawal_rate', 0),
+                'start_age': bucket.get('start_age'),
+                'end_age': bucket.get('end_age'),
+                'manual_override': float(manual_override) if manual_override else None,
+                'pension_income': float(bucket.get('expected_pension_income', 0)),
+                'social_security_income': float(bucket.get('expected_social_security_income', 0)),
+                'early_access_risk': bool(bucket.get('allowed_account_types')),
+                'tax_loss_harvesting': bool(bucket.get('tax_loss_harvesting_enabled')),
+                'roth_conversion': bool(bucket.get('roth_conversion_enabled')),
+            }
+            # A manual override replaces the rate-based rules, so they are never read
+            if not manual_override:
+                min_amount = bucket.get('min_withdrawal_amount')
+                max_amount = bucket.get('max_withdrawal_amount')
+                prepared_bucket.update({
+                    'withdrawal_rate': float(bucket.get('target_withdrawal_rate', 4.0)) / 100,
+                    'min_amount': float(min_amount) if min_amount else None,
+                    'max_amount': float(max_amount) if max_amount else None,
+                    'healthcare_adjustment': float(bucket.get('healthcare_cost_adjustment', 0)),
+                })
+            prepared.append(prepared_bucket)
+        return prepared
+
+    def _calculate_year_withdrawal(self, portfolio_value: float, age: int,
                                    bucket: Dict, year: int) -> Dict:
         """Calculate withdrawal amount for a specific year."""
+        prepared_bucket = self._prepare_buckets([bucket])[0]
+        return self._withdrawal_for_prepared_bucket(portfolio_value, age, prepared_bucket)
+
+    @staticmethod
+    def _withdrawal_for_prepared_bucket(portfolio_value: float, age: int, bucket: Dict) -> Dict:
+        """Calculate one year's withdrawal from a bucket produced by _prepare_buckets."""
+        pension_income = bucket['pension_income']
+        ss_income = bucket['social_security_income']
+
         # Check for manual override
-        if bucket.get('manual_withdrawal_override'):
+        if bucket['manual_override'] is not None:
             return {
-                'calculated_withdrawal': Decimal(str(bucket['manual_withdrawal_override'])),
-                'actual_withdrawal': Decimal(str(bucket['manual_withdrawal_override'])),
-                'pension_income': Decimal(str(bucket.get('expected_pension_income', 0))),
-                'social_security_income': Decimal(str(bucket.get('expected_social_security_income', 0))),
+                'calculated_withdrawal': bucket['manual_override'],
+                'actual_withdrawal': bucket['manual_override'],
+                'pension_income': pension_income,
+                'social_security_income': ss_income,
                 'notes': 'Manual override applied',
                 'flags': [],
             }
 
         # Calculate based on withdrawal rate
-        withdrawal_rate = Decimal(str(bucket.get('target_withdrawal_rate', 4.0))) / Decimal(100)
-        calculated_withdrawal = portfolio_value * withdrawal_rate
+        calculated_withdrawal = float(portfolio_value) * bucket['withdrawal_rate']
 
         # Apply min/max constraints
-        min_amount = bucket.get('min_withdrawal_amount')
-        max_amount = bucket.get('max_withdrawal_amount')
-
-        if min_amount:
-            calculated_withdrawal = max(calculated_withdrawal, Decimal(str(min_amount)))
-        if max_amount:
-            calculated_withdrawal = min(calculated_withdrawal, Decimal(str(max_amount)))
-
-        # Apply special adjustments
-        pension_income = Decimal(str(bucket.get('expected_pension_income', 0)))
-        ss_income = Decimal(str(bucket.get('expected_social_security_income', 0)))
-        healthcare_adjustment = Decimal(str(bucket.get('healthcare_cost_adjustment', 0)))
+        if bucket['min_amount'] is not None:
+            calculated_withdrawal = max(calculated_withdrawal, bucket['min_amount'])
+        if bucket['max_amount'] is not None:
+            calculated_withdrawal = min(calculated_withdrawal, bucket['max_amount'])
 
         # Adjust for other income sources
-        actual_withdrawal = max(Decimal(0), calculated_withdrawal + healthcare_adjustment - pension_income - ss_income)
+        actual_withdrawal = max(
+            0.0, calculated_withdrawal + bucket['healthcare_adjustment'] - pension_income - ss_income
+        )
 
         flags = []
         notes = []
 
         # Check for early access penalties (before 59.5)
-        if age < 59 and bucket.get('allowed_account_types'):
+        if age < 59 and bucket['early_access_risk']:
             flags.append('early_access_penalty_risk')
             notes.append('Early access may incur penalties')
 
         # Tax considerations
-        if bucket.get('tax_loss_harvesting_enabled'):
+        if bucket['tax_loss_harvesting']:
             flags.append('tax_loss_harvesting')
             notes.append('Tax-loss harvesting opportunity')
 
-        if bucket.get('roth_conversion_enabled'):
+        if bucket['roth_conversion']:
             flags.append('roth_conversion')
             notes.append('Roth conversion opportunity')
 
@@ -575,12 +560,11 @@ class DynamicBucketedWithdrawalCalculator:
         }
 
     @staticmethod
-    def _calculate_summary(projections: List[Dict]) -> Dict:
-        """Calculate summary statistics from projections."""
+    def _calculate_summary(projections: List[Dict], total_withdrawal: float) -> Dict:
+        """Calculate summary statistics from projections and their running withdrawal total."""
         if not projections:
             return {}
 
-        total_withdrawal = sum(Decimal(str(p['actual_withdrawal'])) for p in projections)
         final_value = projections[-1]['portfolio_value_end']
         depleted = final_value <= 0
 
@@ -594,8 +578,8 @@ class DynamicBucketedWithdrawalCalculator:
             'total_projections': len(projections),
             'final_portfolio_value': final_value,
             'portfolio_depleted': depleted,
-            'total_withdrawals': float(total_withdrawal),
-            'average_annual_withdrawal': float(total_withdrawal / len(projections)) if projections else 0,
+            'total_withdrawals': total_withdrawal,
+            'average_annual_withdrawal': total_withdrawal / len(projections),
             'milestones': milestones,
             'success_rate': 100.0 if not depleted else 0.0,
         }
@@ -635,6 +619,7 @@ class EnhancedMonteCarloCalculator:
         pension_start_age: int = None,
         # Time step configuration
         periods_per_year: int = 12,  # 12 for monthly, 1 for annual
+        seed: int = None,
     ):
         """
         Initialize Enhanced Monte Carlo calculator.
@@ -656,6 +641,7 @@ class EnhancedMonteCarloCalculator:
             pension_annual: Annual pension income
             pension_start_age: Age when pension income begins
             periods_per_year: Time steps per year (12 for monthly, 1 for annual)
+            seed: Optional random seed for reproducible simulations
         """
         self.portfolio_value = float(portfolio_value)
         self.retirement_age = int(retirement_age)
@@ -677,6 +663,11 @@ class EnhancedMonteCarloCalculator:
         # Pre-calculate time step size
         self.dt = 1.0 / self.periods_per_year
 
+        # Every _run_simulation replays the same random stream (common random numbers), so
+        # the binary search and the 4% comparison differ only by withdrawal, not by noise
+        self.seed = seed
+        self._seed_sequence = np.random.SeedSequence(seed)
+
     def calculate(self) -> Dict:
         """
         Main calculation entry point.
@@ -726,8 +717,9 @@ class EnhancedMonteCarloCalculator:
             else:
                 high = mid  # Need to withdraw less
 
-        # Get final result with the found withdrawal
-        final_result = self._run_simulation(annual_withdrawal=best_withdrawal)
+        # The search already simulated the chosen withdrawal; report that run rather than
+        # paying for another one that would also disagree with the rate it was chosen for
+        final_result = best_result
 
         # Calculate 4% rule comparison
         four_percent_withdrawal = self.portfolio_value * 0.04
@@ -798,27 +790,6 @@ class EnhancedMonteCarloCalculator:
             **result,
         }
 
-    def _gbm_step(self, portfolio: float) -> float:
-        """
-        Apply one time step of Geometric Brownian Motion.
-
-        Uses the formula: P * exp((μ - 0.5σ²)dt + σ√dt·Z)
-        where Z is a standard normal random variable.
-
-        This properly models lognormal returns and prevents impossible
-        negative portfolio values from returns alone.
-
-        Args:
-            portfolio: Current portfolio value
-
-        Returns:
-            New portfolio value after applying GBM return
-        """
-        Z = np.random.standard_normal()
-        drift = (self.annual_return_rate - 0.5 * self.return_std_dev ** 2) * self.dt
-        diffusion = self.return_std_dev * np.sqrt(self.dt) * Z
-        return portfolio * np.exp(drift + diffusion)
-
     def _run_simulation(self, annual_withdrawal: float) -> Dict:
         """
         Run Monte Carlo simulation using Geometric Brownian Motion.
@@ -835,121 +806,73 @@ class EnhancedMonteCarloCalculator:
         """
         years_in_retirement = self.life_expectancy - self.retirement_age
         total_periods = years_in_retirement * self.periods_per_year
-        all_simulations = []
-        successful_simulations = 0
 
-        # Convert withdrawals and income to per-period amounts
         ss_annual = self.social_security_monthly_benefit * 12
-        period_withdrawal_base = annual_withdrawal / self.periods_per_year
-        ss_period = ss_annual / self.periods_per_year
-        pension_period = self.pension_annual / self.periods_per_year
 
-        # SS start age (default to 65 if not specified)
-        ss_start = self.social_security_start_age if self.social_security_start_age else 65
+        # Net withdrawal for every period (after Social Security and pension), computed once
+        # for all simulations
+        net_withdrawals = self._net_period_withdrawals(annual_withdrawal, total_periods)
 
-        for sim in range(self.num_simulations):
-            portfolio = self.portfolio_value
-            yearly_values = [portfolio]
-            depleted_year = None
-
-            for period in range(1, total_periods + 1):
-                # Calculate current time in years
-                t = period * self.dt
-                current_age = self.retirement_age + t
-
-                # Apply GBM return for this period
-                portfolio = self._gbm_step(portfolio)
-
-                # Calculate inflation-adjusted withdrawal for this period
-                # Withdrawal grows with inflation from start
-                inflation_factor = (1 + self.inflation_rate) ** t
-                period_withdrawal = period_withdrawal_base * inflation_factor
-
-                # Calculate net withdrawal (subtract SS and pension if eligible)
-                net_withdrawal = period_withdrawal
-
-                # Social Security kicks in at start age
-                if ss_period > 0 and current_age >= ss_start:
-                    # SS also increases with inflation (simplified COLA)
-                    # Inflation adjustment from SS start, not retirement start
-                    years_since_ss_start = current_age - ss_start
-                    ss_inflation_factor = (1 + self.inflation_rate) ** years_since_ss_start
-                    ss_adjusted = ss_period * ss_inflation_factor
-                    net_withdrawal = max(0, net_withdrawal - ss_adjusted)
-
-                # Pension kicks in at start age (default to retirement age if not specified)
-                pension_start = self.pension_start_age if self.pension_start_age else self.retirement_age
-                if pension_period > 0 and current_age >= pension_start:
-                    # Pension also increases with inflation from pension start
-                    years_since_pension_start = current_age - pension_start
-                    pension_inflation_factor = (1 + self.inflation_rate) ** years_since_pension_start
-                    pension_adjusted = pension_period * pension_inflation_factor
-                    net_withdrawal = max(0, net_withdrawal - pension_adjusted)
-
-                # Make withdrawal
-                portfolio = portfolio - net_withdrawal
-
-                if portfolio <= 0:
-                    portfolio = 0
-                    if depleted_year is None:
-                        depleted_year = int(np.ceil(t))
-
-                # Record yearly values (at end of each year)
-                if period % self.periods_per_year == 0:
-                    yearly_values.append(portfolio)
-
-            if depleted_year is None:
-                successful_simulations += 1
-
-            all_simulations.append({
-                'yearly_values': yearly_values,
-                'final_value': portfolio,
-                'depleted_year': depleted_year,
-            })
+        # Geometric Brownian Motion: each period multiplies the portfolio by
+        # exp((μ - 0.5σ²)dt + σ√dt·Z), a lognormal return that can't by itself
+        # push the portfolio negative
+        drift = (self.annual_return_rate - 0.5 * self.return_std_dev ** 2) * self.dt
+        diffusion_scale = self.return_std_dev * np.sqrt(self.dt)
+
+        # Same seed sequence every run: identical market paths for every withdrawal tried
+        rng = np.random.default_rng(self._seed_sequence)
+
+        # Advance all simulations together, one year of periods at a time. Values are
+        # recorded at the end of each year: one row per year, one column per simulation.
+        yearly_values = np.empty((years_in_retirement + 1, self.num_simulations))
+        yearly_values[0] = self.portfolio_value
+
+        for year in range(years_in_retirement):
+            # Apply GBM returns and make withdrawals; depleted portfolios are floored at zero
+            year_periods = slice(year * self.periods_per_year, (year + 1) * self.periods_per_year)
+            yearly_values[year + 1] = simulate_gbm_withdrawals(
+                yearly_values[year],
+                rng.standard_normal((self.periods_per_year, self.num_simulations)),
+                drift,
+                diffusion_scale,
+                net_withdrawals[year_periods],
+            )
+
+        # Depletion year is the year the portfolio first hits zero. A depleted portfolio
+        # stays at zero, so it follows from the number of year-ends spent at zero.
+        depleted_counts = (yearly_values[1:] <= 0).sum(axis=0)
+        ever_depleted = depleted_counts > 0
+        depletion_years = years_in_retirement - depleted_counts[ever_depleted] + 1
+        successful_simulations = int(self.num_simulations - ever_depleted.sum())
 
         # Calculate statistics
         success_rate = (successful_simulations / self.num_simulations) * 100
 
-        # Final value percentiles
-        final_values = [sim['final_value'] for sim in all_simulations]
-        final_percentiles = {
-            'p5': float(np.percentile(final_values, 5)),
-            'p10': float(np.percentile(final_values, 10)),
-            'p25': float(np.percentile(final_values, 25)),
-            'p50': float(np.percentile(final_values, 50)),
-            'p75': float(np.percentile(final_values, 75)),
-            'p90': float(np.percentile(final_values, 90)),
-            'p95': float(np.percentile(final_values, 95)),
-        }
-
-        # Yearly percentiles for charting
-        yearly_percentiles = []
-        for year in range(years_in_retirement + 1):
-            year_values = [sim['yearly_values'][year] for sim in all_simulations]
-            yearly_percentiles.append({
+        # Yearly percentiles for charting, one batched call over the year rows;
+        # the last row doubles as the final portfolio value percentiles
+        percentile_keys = ('p5', 'p10', 'p25', 'p50', 'p75', 'p90', 'p95')
+        yearly_pcts = np.percentile(yearly_values, [5, 10, 25, 50, 75, 90, 95], axis=1).T.tolist()
+        final_percentiles = dict(zip(percentile_keys, yearly_pcts[-1]))
+        yearly_means = yearly_values.mean(axis=1).tolist()
+        yearly_percentiles = [
+            {
                 'year': year,
                 'age': self.retirement_age + year,
-                'p5': float(np.percentile(year_values, 5)),
-                'p10': float(np.percentile(year_values, 10)),
-                'p25': float(np.percentile(year_values, 25)),
-                'p50': float(np.percentile(year_values, 50)),
-                'p75': float(np.percentile(year_values, 75)),
-                'p90': float(np.percentile(year_values, 90)),
-                'p95': float(np.percentile(year_values, 95)),
-                'mean': float(np.mean(year_values)),
-            })
+                **dict(zip(percentile_keys, pcts)),
+                'mean': mean,
+            }
+            for year, (pcts, mean) in enumerate(zip(yearly_pcts, yearly_means))
+        ]
 
         # Depletion statistics
         depletion_stats = None
-        depleted_sims = [s for s in all_simulations if s['depleted_year'] is not None]
-        if depleted_sims:
-            depletion_years = [s['depleted_year'] for s in depleted_sims]
+        if depletion_years.size:
             depletion_stats = {
-                'count': len(depleted_sims),
-                'earliest_year': min(depletion_years),
-                'latest_year': max(depletion_years),
+                'count': int(depletion_years.size),
+                'earliest_year': int(depletion_years.min()),
+                'latest_year': int(depletion_years.max()),
                 'median_year': float(np.median(depletion_years)),
-                'earliest_age': self.retirement_age + min(depletion_years),
+                'earliest_age': self.retirement_age + int(depletion_years.min()),
                 'median_age': self.retirement_age + int(np.median(depletion_years)),
             }
 
@@ -1000,71 +923,67 @@ class EnhancedMonteCarloCalculator:
         """
         years_in_retirement = self.life_expectancy - self.retirement_age
         total_periods = years_in_retirement * self.periods_per_year
-        trajectory = []
-        portfolio = self.portfolio_value
-
-        # Convert to per-period amounts
-        ss_annual = self.social_security_monthly_benefit * 12
-        period_withdrawal_base = annual_withdrawal / self.periods_per_year
-        ss_period = ss_annual / self.periods_per_year
-        pension_period = self.pension_annual / self.periods_per_year
-
-        # SS start age (default to 65 if not specified)
-        ss_start = self.social_security_start_age if self.social_security_start_age else 65
 
         # Constant return per period (using GBM drift without randomness)
         # For constant return, we use the expected return directly
         period_return = (1 + self.annual_return_rate) ** self.dt - 1
+        growth = 1 + period_return
+
+        # Until the portfolio runs out, value[p] = growth * value[p - 1] - net_withdrawal[p],
+        # which lfilter evaluates in one pass; once it hits zero it stays there, since net
+        # withdrawals are never negative
+        net_withdrawals = self._net_period_withdrawals(annual_withdrawal, total_periods)
+        period_values = lfilter(
+            [1.0], [1.0, -growth], -net_withdrawals, zi=[growth * self.portfolio_value]
+        )[0]
+        depleted = np.flatnonzero(period_values <= 0)
+        if depleted.size:
+            period_values[depleted[0]:] = 0.0
+
+        # Record initial value, then the value at the end of each year
+        year_end_values = [self.portfolio_value]
+        year_end_values += period_values[self.periods_per_year - 1::self.periods_per_year].tolist()
+
+        return [
+            {
+                'year': year,
+                'age': self.retirement_age + year,
+                'portfolio_value': value,
+            }
+            for year, value in enumerate(year_end_values)
+        ]
 
-        # Record initial value
-        trajectory.append({
-            'year': 0,
-            'age': self.retirement_age,
-            'portfolio_value': portfolio,
-        })
-
-        for period in range(1, total_periods + 1):
-            # Calculate current time in years
-            t = period * self.dt
-            current_age = self.retirement_age + t
-
-            # Apply constant return for this period
-            portfolio = portfolio * (1 + period_return)
-
-            # Calculate inflation-adjusted withdrawal for this period
-            inflation_factor = (1 + self.inflation_rate) ** t
-            period_withdrawal = period_withdrawal_base * inflation_factor
-
-            # Calculate net withdrawal
-            net_withdrawal = period_withdrawal
-
-            # Social Security kicks in at start age
-            if ss_period > 0 and current_age >= ss_start:
-                years_since_ss_start = current_age - ss_start
-                ss_inflation_factor = (1 + self.inflation_rate) ** years_since_ss_start
-                ss_adjusted = ss_period * ss_inflation_factor
-                net_withdrawal = max(0, net_withdrawal - ss_adjusted)
-
-            # Pension kicks in at start age (default to retirement age if not specified)
-            pension_start = self.pension_start_age if self.pension_start_age else self.retirement_age
-            if pension_period > 0 and current_age >= pension_start:
-                years_since_pension_start = current_age - pension_start
-                pension_inflation_factor = (1 + self.inflation_rate) ** years_since_pension_start
-                pension_adjusted = pension_period * pension_inflation_factor
-                net_withdrawal = max(0, net_withdrawal - pension_adjusted)
-
-            portfolio = max(0, portfolio - net_withdrawal)
-
-            # Record yearly values (at end of each year)
-            if period % self.periods_per_year == 0:
-                year = period // self.periods_per_year
-                trajectory.append({
-                    'year': year,
-                    'age': self.retirement_age + year,
-                    'portfolio_value': portfolio,
-                })
+    def _net_period_withdrawals(self, annual_withdrawal: float, total_periods: int) -> np.ndarray:
+        """
+        Portfolio withdrawal for every period, after Social Security and pension income.
 
-        return trajectory
+        Withdrawals grow with inflation from retirement; Social Security and pension
+        grow with inflation from their own start ages and only apply once started.
+        Never negative: income beyond the withdrawal is not added to the portfolio.
+        """
+        t = np.arange(1, total_periods + 1) * self.dt
+        current_age = self.retirement_age + t
+        inflation_growth = 1 + self.inflation_rate
+
+        # Calculate inflation-adjusted withdrawal for each period
+        withdrawals = (annual_withdrawal / self.periods_per_year) * inflation_growth ** t
+
+        # Social Security kicks in at start age (default to 65 if not specified)
+        ss_period = max(0.0, self.social_security_monthly_benefit * 12 / self.periods_per_year)
+        ss_start = self.social_security_start_age if self.social_security_start_age else 65
+        ss_income = np.where(
+            current_age >= ss_start, ss_period * inflation_growth ** (current_age - ss_start), 0.0
+        )
+
+        # Pension kicks in at start age (default to retirement age if not specified)
+        pension_period = max(0.0, self.pension_annual / self.periods_per_year)
+        pension_start = self.pension_start_age if self.pension_start_age else self.retirement_age
+        pension_income = np.where(
+            current_age >= pension_start, pension_period * inflation_growth ** (current_age - pension_start), 0.0
+        )
+
+        # Income is never negative, so one floor gives the same result as flooring after each offset
+        return np.maximum(0, withdrawals - ss_income - pension_income)
 
 
 class HistoricalPeriodCalculator:
@@ -1141,35 +1060,26 @@ class HistoricalPeriodCalculator:
                 'success_rate': 0,
             }
 
-        # Run simulation for each starting year
-        period_results = []
-        successful_periods = 0
-        failed_periods = []
-
-        for start_year in available_years:
-            result = self._simulate_period(
-                start_year,
-                get_returns_for_period(start_year, self.years_in_retirement, self.stock_allocation),
-                get_inflation_for_period(start_year, self.years_in_retirement),
-            )
-            period_results.append(result)
-
-            if result['success']:
-                successful_periods += 1
-            else:
-                failed_periods.append(result)
+        # Run simulation for every starting year at once
+        period_results = self._simulate_periods(
+            available_years,
+            [get_returns_for_period(start_year, self.years_in_retirement, self.stock_allocation)
+             for start_year in available_years],
+            [get_inflation_for_period(start_year, self.years_in_retirement) for start_year in available_years],
+        )
+        failed_periods = [result for result in period_results if not result['success']]
+        successful_periods = len(period_results) - len(failed_periods)
 
         # Calculate success rate
         success_rate = (successful_periods / len(available_years)) * 100
 
-        # Find best and worst cases
-        sorted_by_final = sorted(period_results, key=lambda x: x['final_portfolio_value'])
-        worst_case = sorted_by_final[0]
-        best_case = sorted_by_final[-1]
-
-        # Find median case
-        median_idx = len(sorted_by_final) // 2
-        median_case = sorted_by_final[median_idx]
+        # Find best, worst and median cases. A stable sort keeps ties (such as several
+        # depleted periods at zero) in start-year order, so the picks are deterministic.
+        final_values = np.array([r['final_portfolio_value'] for r in period_results], dtype=float)
+        order = np.argsort(final_values, kind='stable')
+        worst_case = period_results[order[0]]
+        best_case = period_results[order[-1]]
+        median_case = period_results[order[len(order) // 2]]
 
         # Analyze vulnerable periods (where failure occurred)
         vulnerable_periods = self._analyze_vulnerable_periods(failed_periods)
@@ -1178,16 +1088,10 @@ class HistoricalPeriodCalculator:
         notable_results = self._test_notable_periods(NOTABLE_PERIODS)
 
         # Calculate percentiles for final portfolio values
-        final_values = [r['final_portfolio_value'] for r in period_results]
-        percentiles = {
-            'p5': float(np.percentile(final_values, 5)),
-            'p10': float(np.percentile(final_values, 10)),
-            'p25': float(np.percentile(final_values, 25)),
-            'p50': float(np.percentile(final_values, 50)),
-            'p75': float(np.percentile(final_values, 75)),
-            'p90': float(np.percentile(final_values, 90)),
-            'p95': float(np.percentile(final_values, 95)),
-        }
+        percentiles = dict(zip(
+            ('p5', 'p10', 'p25', 'p50', 'p75', 'p90', 'p95'),
+            np.percentile(final_values, [5, 10, 25, 50, 75, 90, 95]).tolist(),
+        ))
 
         # Build yearly percentile data for charting
         yearly_percentiles = self._calculate_yearly_percentiles(period_results)
@@ -1236,22 +1140,31 @@ class HistoricalPeriodCalculator:
             },
         }
 
-    def _simulate_period(self, start_year: int, returns: List[float],
-                         inflation_rates: List[float]) -> Dict:
+    def _simulate_periods(self, start_years: List[int], returns: List[List[float]],
+                          inflation_rates: List[List[float]], collect_details: bool = True) -> List[Dict]:
         """
-        Simulate retirement for a specific historical period.
+        Simulate retirement for several historical periods together.
+
+        Every period is advanced one year at a time as a vector across start years.
+        Withdrawals and income do not depend on the portfolio, so they are computed
+        for all years up front.
 
         Args:
-            start_year: The year retirement begins
-            returns: List of annual returns for the period
-            inflation_rates: List of annual inflation rates
+            start_years: The year retirement begins, for each period
+            returns: Annual returns for each period (one row per start year)
+            inflation_rates: Annual inflation rates for each period (one row per start year)
+            collect_details: Build the year-by-year yearly_details breakdown (left empty
+                when False, for callers that only need the summary)
 
         Returns:
-            Dictionary with simulation results for this period
+            List of simulation result dictionaries, one per start year
         """
         from .data import SP500_RETURNS, BOND_RETURNS, INFLATION_RATES
 
-        portfolio = self.portfolio_value
+        years = self.years_in_retirement
+        returns = np.array(returns, dtype=float).reshape(len(start_years), years)
+        inflation_rates = np.array(inflation_rates, dtype=float).reshape(len(start_years), years)
+        ages = self.retirement_age + np.arange(years)
 
         # Calculate initial withdrawal
         if self.withdrawal_amount:
@@ -1259,96 +1172,103 @@ class HistoricalPeriodCalculator:
         else:
             initial_withdrawal = self.portfolio_value * self.withdrawal_rate
 
-        current_withdrawal = initial_withdrawal
-        total_withdrawals = 0
-        yearly_values = [portfolio]
-        yearly_details = []  # Detailed year-by-year breakdown
-        depleted_year = None
-
-        for year in range(self.years_in_retirement):
-            current_age = self.retirement_age + year
-            calendar_year = start_year + year
-            annual_return = returns[year] if year < len(returns) else 0.07
-            inflation = inflation_rates[year] if year < len(inflation_rates) else 0.03
-
-            # Get individual stock and bond returns for this year
-            stock_return = SP500_RETURNS.get(calendar_year, 0.07)
-            bond_return = BOND_RETURNS.get(calendar_year, 0.04)
-            actual_inflation = INFLATION_RATES.get(calendar_year, 0.03)
-
-            portfolio_start = portfolio
-
-            # Apply market return
-            investment_gain = portfolio * annual_return
-            portfolio = portfolio + investment_gain
-
-            # Calculate net withdrawal (reduce by SS and pension if applicable)
-            gross_withdrawal = current_withdrawal
-            net_withdrawal = current_withdrawal
-            ss_income = 0
-            pension_income = 0
-
-            # Social Security kicks in at specified age
-            if self.social_security_annual > 0:
-                ss_start = self.social_security_start_age or 67
-                if current_age >= ss_start:
-                    ss_income = self.social_security_annual
-                    net_withdrawal = max(0, net_withdrawal - ss_income)
-
-            # Pension reduces withdrawal need
-            if self.pension_annual > 0:
-                pension_income = self.pension_annual
-                net_withdrawal = max(0, net_withdrawal - pension_income)
-
-            # Make withdrawal
-            portfolio = portfolio - net_withdrawal
-            total_withdrawals += net_withdrawal
-
-            # Track depletion
-            if portfolio <= 0:
-                portfolio = 0
-                if depleted_year is None:
-                    depleted_year = year + 1
+        # Withdrawal grows with each year's inflation: (initial * (1 + i0)) * (1 + i1) ...
+        growth = np.empty_like(returns)
+        growth[:, :1] = initial_withdrawal
+        growth[:, 1:] = 1 + inflation_rates[:, :-1]
+        gross_withdrawals = np.multiply.accumulate(growth, axis=1)
+
+        # Social Security kicks in at specified age; pension reduces withdrawal need
+        # from the start. Income is never negative, so one floor gives the same net
+        # withdrawal as flooring after each offset.
+        ss_start = self.social_security_start_age or 67
+        ss_income = np.where(ages >= ss_start, max(0.0, self.social_security_annual), 0.0)
+        pension_income = np.full(years, max(0.0, self.pension_annual))
+        net_withdrawals = np.maximum(0.0, gross_withdrawals - ss_income - pension_income)
+
+        # Apply market return, then make withdrawal; depleted portfolios are floored at zero
+        yearly_values = np.empty((len(start_years), years + 1))
+        yearly_values[:, 0] = self.portfolio_value
+        investment_gains = np.empty_like(returns)
+        for year in range(years):
+            np.multiply(yearly_values[:, year], returns[:, year], out=investment_gains[:, year])
+            np.maximum(
+                0.0,
+                yearly_values[:, year] + investment_gains[:, year] - net_withdrawals[:, year],
+                out=yearly_values[:, year + 1],
+            )
+
+        # A depleted portfolio stays at zero (withdrawals are never negative), so the
+        # depletion year follows from the number of year-ends spent at zero
+        depleted_counts = (yearly_values[:, 1:] <= 0).sum(axis=1)
+        total_withdrawals = net_withdrawals.sum(axis=1)
+        average_returns = returns.mean(axis=1) if years else np.zeros(len(start_years))
+
+        # Market data for the detailed breakdown, looked up once per calendar year
+        calendar_years = range(min(start_years), max(start_years) + years)
+        stock_returns = np.array([SP500_RETURNS.get(y, 0.07) for y in calendar_years])
+        bond_returns = np.array([BOND_RETURNS.get(y, 0.04) for y in calendar_years])
+        actual_inflation = np.array([INFLATION_RATES.get(y, 0.03) for y in calendar_years])
+
+        ages = ages.tolist()
+        ss_income = ss_income.tolist()
+        pension_income = pension_income.tolist()
+        results = []
+        for i, start_year in enumerate(start_years):
+            offset = start_year - min(start_years)
+            values = yearly_values[i].tolist()
+            portfolio_starts = values[:-1]
+            portfolio_ends = values[1:]
 
             # Record detailed year data
-            yearly_details.append({
-                'year': year + 1,
-                'calendar_year': calendar_year,
-                'age': current_age,
-                'portfolio_start': portfolio_start,
-                'stock_return': stock_return * 100,
-                'bond_return': bond_return * 100,
-                'blended_return': annual_return * 100,
-                'investment_gain': investment_gain,
-                'inflation_rate': actual_inflation * 100,
-                'gross_withdrawal': gross_withdrawal,
-                'social_security': ss_income,
-                'pension': pension_income,
-                'net_withdrawal': net_withdrawal,
-                'portfolio_end': portfolio,
-                'year_change': portfolio - portfolio_start,
-                'year_change_pct': ((portfolio - portfolio_start) / portfolio_start * 100) if portfolio_start > 0 else 0,
+            yearly_details = [] if not collect_details else [
+                {
+                    'year': year + 1,
+                    'calendar_year': start_year + year,
+                    'age': age,
+                    'portfolio_start': portfolio_start,
+                    'stock_return': stock_return * 100,
+                    'bond_return': bond_return * 100,
+                    'blended_return': annual_return * 100,
+                    'investment_gain': investment_gain,
+                    'inflation_rate': inflation * 100,
+                    'gross_withdrawal': gross_withdrawal,
+                    'social_security': ss,
+                    'pension': pension,
+                    'net_withdrawal': net_withdrawal,
+                    'portfolio_end': portfolio_end,
+                    'year_change': portfolio_end - portfolio_start,
+                    'year_change_pct': (
+                        (portfolio_end - portfolio_start) / portfolio_start * 100 if portfolio_start > 0 else 0
+                    ),
+                }
+                for year, (age, portfolio_start, stock_return, bond_return, annual_return, investment_gain,
+                           inflation, gross_withdrawal, ss, pension, net_withdrawal, portfolio_end)
+                in enumerate(zip(
+                    ages, portfolio_starts,
+                    stock_returns[offset:offset + years].tolist(),
+                    bond_returns[offset:offset + years].tolist(),
+                    returns[i].tolist(), investment_gains[i].tolist(),
+                    actual_inflation[offset:offset + years].tolist(),
+                    gross_withdrawals[i].tolist(), ss_income, pension_income,
+                    net_withdrawals[i].tolist(), portfolio_ends,
+                ))
+            ]
+
+            depleted_count = int(depleted_counts[i])
+            results.append({
+                'start_year': start_year,
+                'end_year': start_year + years - 1,
+                'success': depleted_count == 0,
+                'years_lasted': years - depleted_count + 1 if depleted_count else years,
+                'final_portfolio_value': values[-1],
+                'total_withdrawals': float(total_withdrawals[i]),
+                'average_return': float(average_returns[i]) * 100,
+                'yearly_values': values,
+                'yearly_details': yearly_details,
             })
 
-            yearly_values.append(portfolio)
-
-            # Adjust withdrawal for inflation
-            current_withdrawal = current_withdrawal * (1 + inflation)
-
-        success = depleted_year is None
-        avg_return = sum(returns) / len(returns) if returns else 0
-
-        return {
-            'start_year': start_year,
-            'end_year': start_year + self.years_in_retirement - 1,
-            'success': success,
-            'years_lasted': depleted_year if depleted_year else self.years_in_retirement,
-            'final_portfolio_value': portfolio,
-            'total_withdrawals': total_withdrawals,
-            'average_return': avg_return * 100,
-            'yearly_values': yearly_values,
-            'yearly_details': yearly_details,
-        }
+        return results
 
     def _analyze_vulnerable_periods(self, failed_periods: List[Dict]) -> List[Dict]:
         """
@@ -1403,29 +1323,42 @@ class HistoricalPeriodCalculator:
         """
         from .data import get_returns_for_period, get_inflation_for_period
 
-        results = []
+        tested_periods = []
+        returns = []
+        inflation = []
         for period_name, period_info in notable_periods.items():
             start_year = period_info['start_year']
 
             # Only test if we have enough data
             try:
-                returns = get_returns_for_period(start_year, self.years_in_retirement, self.stock_allocation)
-                inflation = get_inflation_for_period(start_year, self.years_in_retirement)
-
-                result = self._simulate_period(start_year, returns, inflation)
-                results.append({
-                    'period_name': period_name.replace('_', ' ').title(),
-                    'description': period_info['description'],
-                    'start_year': start_year,
-                    'success': result['success'],
-                    'years_lasted': result['years_lasted'],
-                    'final_portfolio_value': result['final_portfolio_value'],
-                })
+                period_returns = get_returns_for_period(start_year, self.years_in_retirement, self.stock_allocation)
+                period_inflation = get_inflation_for_period(start_year, self.years_in_retirement)
             except (KeyError, IndexError):
                 # Not enough data for this period
                 continue
+            tested_periods.append((period_name, period_info))
+            returns.append(period_returns)
+            inflation.append(period_inflation)
 
-        return results
+        if not tested_periods:
+            return []
+
+        # Simulate all notable periods together; only the summary is reported
+        simulated = self._simulate_periods(
+            [period_info['start_year'] for _, period_info in tested_periods], returns, inflation,
+            collect_details=False,
+        )
+        return [
+            {
+                'period_name': period_name.replace('_', ' ').title(),
+                'description': period_info['description'],
+                'start_year': period_info['start_year'],
+                'success': result['success'],
+                'years_lasted': result['years_lasted'],
+                'final_portfolio_value': result['final_portfolio_value'],
+            }
+            for (period_name, period_info), result in zip(tested_periods, simulated)
+        ]
 
     def _calculate_yearly_percentiles(self, period_results: List[Dict]) -> List[Dict]:
         """
@@ -1437,26 +1370,19 @@ class HistoricalPeriodCalculator:
         Returns:
             List of yearly percentile data for charting
         """
-        yearly_percentiles = []
-
-        for year in range(self.years_in_retirement + 1):
-            year_values = []
-            for result in period_results:
-                if year < len(result['yearly_values']):
-                    year_values.append(result['yearly_values'][year])
-
-            if year_values:
-                yearly_percentiles.append({
-                    'year': year,
-                    'age': self.retirement_age + year,
-                    'p5': float(np.percentile(year_values, 5)),
-                    'p10': float(np.percentile(year_values, 10)),
-                    'p25': float(np.percentile(year_values, 25)),
-                    'p50': float(np.percentile(year_values, 50)),
-                    'p75': float(np.percentile(year_values, 75)),
-                    'p90': float(np.percentile(year_values, 90)),
-                    'p95': float(np.percentile(year_values, 95)),
-                    'mean': float(np.mean(year_values)),
-                })
-
-        return yearly_percentiles
+        # Every period covers the full retirement, so the paths stack into a
+        # (periods x years + 1) matrix and each statistic is one call over the columns
+        yearly_values = np.array([result['yearly_values'] for result in period_results], dtype=float)
+        percentile_keys = ('p5', 'p10', 'p25', 'p50', 'p75', 'p90', 'p95')
+        yearly_pcts = np.percentile(yearly_values, [5, 10, 25, 50, 75, 90, 95], axis=0).T.tolist()
+        yearly_means = yearly_values.mean(axis=0).tolist()
+
+        return [
+            {
+                'year': year,
+                'age': self.retirement_age + year,
+                **dict(zip(percentile_keys, pcts)),
+                'mean': mean,
+            }
+            for year, (pcts, mean) in enumerate(zip(yearly_pcts, yearly_means))
+        ]
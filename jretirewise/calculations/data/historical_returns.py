@@ -22,6 +22,8 @@ See README.md in this directory for detailed documentation.
 All values are expressed as decimals (e.g., 0.15 = 15% return)
 """
 
+from functools import lru_cache
+
 # S&P 500 Total Returns (including dividends) by year
 # Source: NYU Stern (Damodaran) - https://pages.stern.nyu.edu/~adamodar/New_Home_Page/datafile/histretSP.html
 SP500_RETURNS = {
@@ -234,6 +236,59 @@ INFLATION_RATES = {
 }
 
 
+@lru_cache(maxsize=32)
+def _blended_return_history(stock_allocation: float) -> tuple:
+    """
+    Blended returns for each year of the data set, built once per allocation.
+
+    Returns:
+        (first year, blended return for each consecutive year, average blended return).
+        A year missing from either table uses the average.
+    """
+    bond_allocation = 1.0 - stock_allocation
+    avg_stock = sum(SP500_RETURNS.values()) / len(SP500_RETURNS)
+    avg_bond = sum(BOND_RETURNS.values()) / len(BOND_RETURNS)
+    average = avg_stock * stock_allocation + avg_bond * bond_allocation
+
+    first_year = min(SP500_RETURNS)
+    blended = [
+        SP500_RETURNS[year] * stock_allocation + BOND_RETURNS[year] * bond_allocation
+        if year in SP500_RETURNS and year in BOND_RETURNS else average
+        for year in range(first_year, max(SP500_RETURNS) + 1)
+    ]
+    return first_year, blended, average
+
+
+@lru_cache(maxsize=1)
+def _inflation_history() -> tuple:
+    """
+    Inflation rates for each year of the data set, built once.
+
+    Returns:
+        (first year, inflation rate for each consecutive year, average inflation rate).
+        A missing year uses the average.
+    """
+    average = sum(INFLATION_RATES.values()) / len(INFLATION_RATES)
+    first_year = min(INFLATION_RATES)
+    rates = [
+        INFLATION_RATES.get(year, average)
+        for year in range(first_year, max(INFLATION_RATES) + 1)
+    ]
+    return first_year, rates, average
+
+
+def _slice_history(history: tuple, start_year: int, num_years: int) -> list:
+    """Values for start_year onward, using the average for years without data."""
+    first_year, values, average = history
+    offset = start_year - first_year
+    if 0 <= offset and offset + num_years <= len(values):
+        return values[offset:offset + num_years]
+    return [
+        values[position] if 0 <= position < len(values) else average
+        for position in range(offset, offset + num_years)
+    ]
+
+
 def get_returns_for_period(start_year: int, num_years: int,
                            stock_allocation: float = 0.6) -> list:
     """
@@ -245,25 +300,10 @@ def get_returns_for_period(start_year: int, num_years: int,
         stock_allocation: Percentage in stocks (remainder in bonds)
 
     Returns:
-        List of annual returns for the period
+        List of annual returns for the period. Years without data use the
+        average historical blended return.
     """
-    returns = []
-    bond_allocation = 1.0 - stock_allocation
-
-    for i in range(num_years):
-        year = start_year + i
-        if year in SP500_RETURNS and year in BOND_RETURNS:
-            blended = (SP500_RETURNS[year] * stock_allocation +
-                       BOND_RETURNS[year] * bond_allocation)
-            returns.append(blended)
-        else:
-            # If we run out of data, use average historical returns
-            avg_stock = sum(SP500_RETURNS.values()) / len(SP500_RETURNS)
-            avg_bond = sum(BOND_RETURNS.values()) / len(BOND_RETURNS)
-            blended = avg_stock * stock_allocation + avg_bond * bond_allocation
-            returns.append(blended)
-
-    return returns
+    return _slice_history(_blended_return_history(float(stock_allocation)), start_year, num_years)
 
 
 def get_inflation_for_period(start_year: int, num_years: int) -> list:
@@ -275,20 +315,10 @@ def get_inflation_for_period(start_year: int, num_years: int) -> list:
         num_years: Number of years needed
 
     Returns:
-        List of annual inflation rates for the period
+        List of annual inflation rates for the period. Years without data use
+        the average historical rate.
     """
-    rates = []
-
-    for i in range(num_years):
-        year = start_year + i
-        if year in INFLATION_RATES:
-            rates.append(INFLATION_RATES[year])
-        else:
-            # Use average if data not available
-            avg_inflation = sum(INFLATION_RATES.values()) / len(INFLATION_RATES)
-            rates.append(avg_inflation)
-
-    return rates
+    return _slice_history(_inflation_history(), start_year, num_years)
 
 
 def get_available_start_years(num_years_needed: int) -> list:
@@ -0,0 +1,126 @@
+"""
+Compiled simulation kernels for the Monte Carlo calculators.
+
+Numba is optional. When it is installed the kernels are JIT-compiled (parallel over
+simulations); otherwise the NumPy implementations, vectorized across simulations,
+are used. Both produce the same values.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _simulate_withdrawals_numpy(starting_value: float, returns: np.ndarray,
+                                withdrawals: np.ndarray) -> np.ndarray:
+    """
+    Simulate fixed withdrawal schedules across many return paths.
+
+    Arrays are year-major, so each yearly step reads and writes one contiguous row.
+
+    Args:
+        starting_value: Portfolio value at the start of every path
+        returns: (years x simulations) matrix of annual returns
+        withdrawals: Withdrawal taken at the end of each year
+
+    Returns:
+        (years + 1 x simulations) matrix of portfolio values; row 0 is the start.
+        A portfolio that would go negative is floored at zero.
+    """
+    years, num_simulations = returns.shape
+    yearly_values = np.empty((years + 1, num_simulations))
+    yearly_values[0] = float(starting_value)
+    for year in range(years):
+        np.maximum(
+            0.0, yearly_values[year] * (1 + returns[year]) - withdrawals[year], out=yearly_values[year + 1]
+        )
+    return yearly_values
+
+
+def _simulate_gbm_withdrawals_numpy(starting_values: np.ndarray, shocks: np.ndarray, drift: float,
+                                    diffusion_scale: float, withdrawals: np.ndarray) -> np.ndarray:
+    """
+    Advance many portfolios through a block of Geometric Brownian Motion periods.
+
+    Each period multiplies the portfolio by exp(drift + diffusion_scale * Z) and then
+    takes that period's withdrawal. Called one year at a time, so the shocks for the
+    whole retirement never have to be held in memory at once.
+
+    Args:
+        starting_values: Portfolio value of each simulation at the start of the block
+        shocks: (periods x simulations) matrix of standard normal draws
+        drift: Per-period log drift, (μ - 0.5σ²)dt
+        diffusion_scale: Per-period volatility, σ√dt
+        withdrawals: Net withdrawal taken at the end of each period
+
+    Returns:
+        Portfolio value of each simulation at the end of the block, floored at zero
+    """
+    portfolio = np.array(starting_values, dtype=np.float64)
+    growth = np.exp(drift + diffusion_scale * shocks)
+    for period in range(shocks.shape[0]):
+        portfolio *= growth[period]
+        portfolio -= withdrawals[period]
+        np.maximum(portfolio, 0.0, out=portfolio)
+    return portfolio
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _simulate_withdrawals_numba(starting_value, returns, withdrawals):
+        years, num_simulations = returns.shape
+        yearly_values = np.empty((years + 1, num_simulations))
+        for sim in prange(num_simulations):
+            portfolio = starting_value
+            yearly_values[0, sim] = portfolio
+            for year in range(years):
+                portfolio = portfolio * (1 + returns[year, sim]) - withdrawals[year]
+                if portfolio <= 0.0:
+                    # Depleted for good: later years are zero, so skip simulating them
+                    yearly_values[year + 1:, sim] = 0.0
+                    break
+                yearly_values[year + 1, sim] = portfolio
+        return yearly_values
+
+    def simulate_withdrawals(starting_value: float, returns: np.ndarray,
+                             withdrawals: np.ndarray) -> np.ndarray:
+        """JIT-compiled simulate_withdrawals; see _simulate_withdrawals_numpy."""
+        return _simulate_withdrawals_numba(
+            float(starting_value),
+            np.ascontiguousarray(returns, dtype=np.float64),
+            np.ascontiguousarray(withdrawals, dtype=np.float64),
+        )
+
+    @njit(parallel=True, cache=True)
+    def _simulate_gbm_withdrawals_numba(starting_values, shocks, drift, diffusion_scale, withdrawals):
+        periods, num_simulations = shocks.shape
+        ending_values = np.empty(num_simulations)
+        for sim in prange(num_simulations):
+            portfolio = starting_values[sim]
+            # Withdrawals are never negative, so a depleted portfolio stays at zero
+            if portfolio > 0.0:
+                for period in range(periods):
+                    portfolio = portfolio * np.exp(drift + diffusion_scale * shocks[period, sim]) - withdrawals[period]
+                    if portfolio <= 0.0:
+                        portfolio = 0.0
+                        break
+            ending_values[sim] = portfolio
+        return ending_values
+
+    def simulate_gbm_withdrawals(starting_values: np.ndarray, shocks: np.ndarray, drift: float,
+                                 diffusion_scale: float, withdrawals: np.ndarray) -> np.ndarray:
+        """JIT-compiled simulate_gbm_withdrawals; see _simulate_gbm_withdrawals_numpy."""
+        return _simulate_gbm_withdrawals_numba(
+            np.ascontiguousarray(starting_values, dtype=np.float64),
+            np.ascontiguousarray(shocks, dtype=np.float64),
+            float(drift),
+            float(diffusion_scale),
+            np.ascontiguousarray(withdrawals, dtype=np.float64),
+        )
+else:
+    simulate_withdrawals = _simulate_withdrawals_numpy
+    simulate_gbm_withdrawals = _simulate_gbm_withdrawals_numpy
@@ -2,7 +2,7 @@
 Template views for portfolio management.
 """
 
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views import View
 from django.views.generic import DetailView, CreateView, UpdateView, DeleteView
@@ -181,8 +181,6 @@ class AccountDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         """Add value history to context."""
-        from datetime import timedelta
-
         context = super().get_context_data(**kwargs)
         account = context['account']
 
@@ -496,7 +494,6 @@ class TaxProfileManageView(LoginRequiredMixin, View):
 
     def render_form(self, request, form, page_title):
         """Render the tax profile form template."""
-        from django.shortcuts import render
         context = {
             'form': form,
             'page_title': page_title,
@@ -21,6 +21,7 @@ from .models import (
     Account,
     AccountValueHistory,
     PortfolioSnapshot,
+    TaxProfile,
 )
 from .serializers import (
     FinancialProfileSerializer,
@@ -436,7 +437,6 @@ class TaxProfileViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only the current user's tax profile."""
-        from .models import TaxProfile
         return TaxProfile.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
@@ -450,7 +450,6 @@ class TaxProfileViewSet(viewsets.ModelViewSet):
 
         GET /api/v1/tax-profiles/me/
         """
-        from .models import TaxProfile
         try:
             tax_profile = request.user.tax_profile
             serializer = TaxProfileSerializer(tax_profile)
@@ -21,6 +21,7 @@ from .models import (
     BucketedWithdrawalResult,
     WithdrawalStrategy,
     TaxEstimate,
+    SensitivityAnalysis,
 )
 from .forms import ScenarioForm, MonteCarloScenarioForm, BucketedWithdrawalScenarioForm, WithdrawalBucketForm, HistoricalScenarioForm
 from .serializers import (
@@ -33,8 +34,12 @@ from .serializers import (
     TaxEstimateSerializer,
     TaxCalculationRequestSerializer,
     StrategyComparisonRequestSerializer,
+    SensitivityAnalysisSerializer,
+    SensitivityCalculationRequestSerializer,
+    TornadoChartRequestSerializer,
 )
-from jretirewise.calculations.calculators import DynamicBucketedWithdrawalCalculator
+from jretirewise.calculations.calculators import DynamicBucketedWithdrawalCalculator, HistoricalPeriodCalculator
+from jretirewise.calculations.sensitivity_analyzer import SensitivityAnalyzer
 from jretirewise.calculations.tax_calculator import TaxCalculator
 from jretirewise.calculations.withdrawal_sequencer import WithdrawalSequencer
 import json
@@ -195,9 +200,6 @@ class ScenarioViewSet(viewsets.ModelViewSet):
             "inflation_adjustment": 0.01  # +1%
         }
         """
-        from jretirewise.calculations.sensitivity_analyzer import SensitivityAnalyzer
-        from .serializers import SensitivityCalculationRequestSerializer
-
         scenario = self.get_object()
 
         # Validate request data
@@ -248,9 +250,6 @@ class ScenarioViewSet(viewsets.ModelViewSet):
             "inflation_step": 0.01
         }
         """
-        from jretirewise.calculations.sensitivity_analyzer import SensitivityAnalyzer
-        from .serializers import TornadoChartRequestSerializer
-
         scenario = self.get_object()
 
         # Validate request data
@@ -299,9 +298,6 @@ class ScenarioViewSet(viewsets.ModelViewSet):
             "result_data": {...}
         }
         """
-        from .models import SensitivityAnalysis
-        from .serializers import SensitivityAnalysisSerializer
-
         scenario = self.get_object()
 
         # Add scenario to request data
@@ -323,8 +319,6 @@ class ScenarioViewSet(viewsets.ModelViewSet):
 
         GET /api/scenarios/{id}/sensitivity/scenarios/
         """
-        from .serializers import SensitivityAnalysisSerializer
-
         scenario = self.get_object()
         sensitivity_analyses = scenario.sensitivity_analyses.all()
         serializer = SensitivityAnalysisSerializer(sensitivity_analyses, many=True)
@@ -337,9 +331,6 @@ class ScenarioViewSet(viewsets.ModelViewSet):
 
         GET /api/scenarios/{id}/sensitivity/scenarios/{sensitivity_id}/
         """
-        from .models import SensitivityAnalysis
-        from .serializers import SensitivityAnalysisSerializer
-
         scenario = self.get_object()
 
         try:
@@ -1072,11 +1063,6 @@ class RunBucketedCalculationView(LoginRequiredMixin, View):
 
     def post(self, request, scenario_pk):
         """Handle POST request to run calculation."""
-        import time
-        from decimal import Decimal
-        from jretirewise.calculations.calculators import DynamicBucketedWithdrawalCalculator
-        from .models import CalculationResult, BucketedWithdrawalResult
-
         # Get scenario and verify ownership
         scenario = get_object_or_404(RetirementScenario, pk=scenario_pk, user=request.user)
 
@@ -1298,9 +1284,6 @@ class RunHistoricalCalculationView(LoginRequiredMixin, View):
 
     def post(self, request, pk):
         """Handle POST request to run calculation."""
-        import time
-        from jretirewise.calculations.calculators import HistoricalPeriodCalculator
-
         # Get scenario and verify ownership
         scenario = get_object_or_404(RetirementScenario, pk=pk, user=request.user)
 
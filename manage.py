@@ -1,20 +1,28 @@
 #!/usr/bin/env python
 """Django's command-line utility for administrative tasks."""
+import logging
 import os
 import sys
 
+logger = logging.getLogger(__name__)
+
+SKIP_OTEL_COMMANDS = ('collectstatic', 'makemigrations', 'migrate', 'shell', 'test', 'check')
+
 
 def main():
     """Run administrative tasks."""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-    # Initialize OpenTelemetry for management commands (e.g., migrate, createsuperuser)
-    try:
-        from config.otel import initialize_otel
-        initialize_otel()
-    except Exception as e:
-        # Don't fail if OpenTelemetry initialization fails
-        print(f"Warning: Failed to initialize OpenTelemetry: {e}")
+    # Initialize OpenTelemetry for long-running management commands (e.g., runserver).
+    # Short-lived commands would only spin up exporters to flush and exit seconds later.
+    otel_enabled = os.environ.get('OTEL_ENABLED', 'true').lower() == 'true'
+    if otel_enabled and not any(cmd in sys.argv for cmd in SKIP_OTEL_COMMANDS):
+        try:
+            from config.otel import initialize_otel
+            initialize_otel()
+        except Exception as e:
+            # Don't fail if OpenTelemetry initialization fails
+            logger.warning('Failed to initialize OpenTelemetry: %s', e)
 
     try:
         from django.core.management import execute_from_command_line
@@ -7,6 +7,7 @@ from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from django.conf import settings
+from jretirewise.authentication.serializers import UserSerializer
 
 
 class LogoutViewIntegrationTestCase(TestCase):
@@ -226,6 +227,55 @@ class UserProfileViewIntegrationTestCase(TestCase):
         # Should return 403 Forbidden
         assert response.status_code == 403
 
+    def test_user_profile_get_matches_user_serializer(self):
+        """Test that the GET payload matches UserSerializer output."""
+        self.user.profile.full_name = 'Test User'
+        self.user.profile.theme_preference = 'dark'
+        self.user.profile.save()
+
+        response = self.client.get('/auth/profile/')
+
+        self.user.refresh_from_db()
+        assert response.json() == UserSerializer(self.user).data
+
+    def test_user_profile_get_returns_etag(self):
+        """Test that an unchanged profile revalidates with 304 Not Modified."""
+        response = self.client.get('/auth/profile/')
+        assert response.status_code == 200
+        assert 'private' in response['Cache-Control']
+
+        response = self.client.get('/auth/profile/', HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+    def test_user_profile_etag_changes_after_update(self):
+        """Test that updating the profile invalidates the previous ETag."""
+        old_etag = self.client.get('/auth/profile/')['ETag']
+
+        self.client.put(
+            '/auth/profile/',
+            {'theme_preference': 'dark'},
+            content_type='application/json'
+        )
+
+        response = self.client.get('/auth/profile/', HTTP_IF_NONE_MATCH=old_etag)
+        assert response.status_code == 200
+        assert response.json()['profile']['theme_preference'] == 'dark'
+
+    def test_profile_created_with_user(self):
+        """Test that creating a user creates its profile."""
+        from jretirewise.authentication.models import UserProfile
+        assert UserProfile.objects.filter(user=self.user).exists()
+
+    def test_user_save_does_not_write_profile(self):
+        """Test that saving a user (e.g. last_login updates) leaves the profile untouched."""
+        updated_at = self.user.profile.updated_at
+
+        self.user.first_name = 'Changed'
+        self.user.save()
+
+        self.user.profile.refresh_from_db()
+        assert self.user.profile.updated_at == updated_at
+
 
 class GoogleOAuthConfigurationTestCase(TestCase):
     """Test Google OAuth 2.0 configuration."""
@@ -446,6 +496,28 @@ class ThemePreferenceTestCase(TestCase):
         self.user.refresh_from_db()
         assert self.user.profile.theme_preference == 'light'
 
+    def test_partial_update_leaves_other_fields_unchanged(self):
+        """Test that updating one field does not overwrite the others."""
+        self.user.profile.full_name = 'Test User'
+        self.user.profile.notification_email = False
+        self.user.profile.save()
+
+        response = self.client.put(
+            '/auth/profile/',
+            data={'theme_preference': 'dark'},
+            content_type='application/json'
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['profile']['full_name'] == 'Test User'
+        assert data['profile']['notification_email'] is False
+
+        self.user.profile.refresh_from_db()
+        assert self.user.profile.theme_preference == 'dark'
+        assert self.user.profile.full_name == 'Test User'
+        assert self.user.profile.notification_email is False
+
     def test_theme_preference_requires_authentication(self):
         """Test that updating theme preference requires authentication."""
         client = Client()
@@ -177,3 +177,121 @@ class ProfileViewIntegrationTestCase(TestCase):
             assert response.status_code == 200
             # Should re-render with error
             assert field in response.content.decode().lower() or 'error' in response.content.decode().lower()
+
+    def test_update_existing_tax_profile(self):
+        """Test that submitting the form updates the user's existing tax profile."""
+        from jretirewise.financial.models import TaxProfile
+
+        FinancialProfile.objects.create(
+            user=self.user,
+            current_age=30,
+            retirement_age=60,
+            life_expectancy=90,
+        )
+        TaxProfile.objects.create(user=self.user, filing_status='single', state_of_residence='CA')
+
+        response = self.client.post('/profile/', {
+            'current_age': 35,
+            'retirement_age': 65,
+            'life_expectancy': 95,
+            'annual_spending': '90000.00',
+            'pension_annual': '0.00',
+            'pension_start_age': 65,
+            'filing_status': 'mfj',
+            'state_of_residence': 'TX',
+            'social_security_age_67': 3200,
+        })
+        assert response.status_code == 302
+
+        tax_profile = TaxProfile.objects.get(user=self.user)
+        assert tax_profile.filing_status == 'mfj'
+        assert tax_profile.state_of_residence == 'TX'
+        assert tax_profile.social_security_age_67 == 3200
+
+    def test_blank_tax_fields_keep_stored_values(self):
+        """Test that blank filing status/state keep stored values while 0 amounts are saved."""
+        from jretirewise.financial.models import TaxProfile
+
+        TaxProfile.objects.create(
+            user=self.user, filing_status='hoh', state_of_residence='CA', social_security_age_62=1500
+        )
+
+        response = self.client.post('/profile/', {
+            'current_age': 35,
+            'retirement_age': 65,
+            'life_expectancy': 95,
+            'annual_spending': '90000.00',
+            'pension_annual': '0.00',
+            'pension_start_age': 65,
+            'filing_status': '',
+            'state_of_residence': '',
+            'social_security_age_62': 0,
+        })
+        assert response.status_code == 302
+
+        tax_profile = TaxProfile.objects.get(user=self.user)
+        assert tax_profile.filing_status == 'hoh'
+        assert tax_profile.state_of_residence == 'CA'
+        assert tax_profile.social_security_age_62 == 0
+
+    def test_profile_page_builds_form_from_single_profile_query(self):
+        """Test that the form is built from the context profile in a single query."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from jretirewise.financial.models import TaxProfile
+
+        FinancialProfile.objects.create(
+            user=self.user,
+            current_age=45,
+            retirement_age=65,
+            life_expectancy=95,
+        )
+        TaxProfile.objects.create(user=self.user, filing_status='mfj', state_of_residence='TX')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/profile/')
+
+        form = response.context['form']
+        assert form.instance is response.context['financial_profile']
+        assert form.initial['filing_status'] == 'mfj'
+        profile_queries = [q for q in queries if '"financial_profile"' in q['sql']]
+        assert len(profile_queries) == 1
+
+
+class DashboardViewIntegrationTestCase(TestCase):
+    """Test DashboardView context loading."""
+
+    def setUp(self):
+        """Set up test user and client."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='TestPass123!'
+        )
+        self.client = Client()
+        self.client.login(username='testuser', password='TestPass123!')
+
+    def test_dashboard_without_profile_or_portfolio(self):
+        """Test dashboard renders when the user has no financial profile or portfolio."""
+        response = self.client.get('/')
+        assert response.status_code == 200
+        assert response.context['financial_profile'] is None
+        assert response.context['portfolio'] is None
+
+    def test_dashboard_scenario_query_count_is_constant(self):
+        """Test that scenario results are joined instead of queried per scenario."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from jretirewise.scenarios.models import RetirementScenario
+
+        RetirementScenario.objects.create(user=self.user, name='First', calculator_type='4_percent')
+        with CaptureQueriesContext(connection) as one_scenario:
+            self.client.get('/')
+
+        for i in range(4):
+            RetirementScenario.objects.create(user=self.user, name=f'Scenario {i}', calculator_type='4_percent')
+        with CaptureQueriesContext(connection) as five_scenarios:
+            response = self.client.get('/')
+
+        assert len(response.context['scenarios']) == 5
+        assert len(five_scenarios) == len(one_scenario)
@@ -431,6 +431,23 @@ class TestBucketSelection:
         bucket = calc._find_applicable_bucket(55, 0, buckets)
         assert bucket is None
 
+    def test_bucket_schedule_matches_find_applicable_bucket(self):
+        """Test that the per-year schedule picks the same bucket as a per-year lookup."""
+        calc = DynamicBucketedWithdrawalCalculator(
+            Decimal('1000000'), 55, 95, 0.07, 0.03
+        )
+
+        buckets = [
+            {'bucket_name': 'early', 'start_age': 55, 'end_age': 59.5},
+            {'bucket_name': 'overlap', 'start_age': 58, 'end_age': 70},
+            {'bucket_name': 'late', 'start_age': 80},
+        ]
+
+        schedule = calc._build_bucket_schedule(buckets, 40)
+
+        for year, bucket in enumerate(schedule):
+            assert bucket is calc._find_applicable_bucket(55 + year, year, buckets)
+
 
 class TestWithdrawalCalculations:
     """Test withdrawal calculation logic."""
@@ -4,6 +4,7 @@ Unit tests for EnhancedMonteCarloCalculator.
 
 import pytest
 from decimal import Decimal
+from unittest.mock import patch
 from jretirewise.calculations.calculators import EnhancedMonteCarloCalculator
 
 
@@ -270,6 +271,40 @@ class TestResultStructure:
         assert trajectory[0]['portfolio_value'] == 1000000
         assert trajectory[0]['age'] == 65
 
+    def test_constant_return_trajectory_matches_period_loop(self):
+        """Test the trajectory against a month-by-month loop, through SS, pension and depletion."""
+        calc = EnhancedMonteCarloCalculator(
+            portfolio_value=500000,
+            retirement_age=60,
+            life_expectancy=95,
+            annual_return_rate=0.05,
+            inflation_rate=0.03,
+            social_security_start_age=67,
+            social_security_monthly_benefit=1500,
+            pension_annual=6000,
+            pension_start_age=62,
+        )
+        trajectory = calc._calculate_constant_return_trajectory(60000)
+
+        portfolio = 500000.0
+        expected = [portfolio]
+        for period in range(1, 35 * 12 + 1):
+            t = period / 12
+            age = 60 + t
+            portfolio *= 1.05 ** (1 / 12)
+            withdrawal = 5000 * 1.03 ** t
+            if age >= 67:
+                withdrawal = max(0, withdrawal - 1500 * 1.03 ** (age - 67))
+            if age >= 62:
+                withdrawal = max(0, withdrawal - 500 * 1.03 ** (age - 62))
+            portfolio = max(0, portfolio - withdrawal)
+            if period % 12 == 0:
+                expected.append(portfolio)
+
+        assert [point['year'] for point in trajectory] == list(range(36))
+        assert [point['portfolio_value'] for point in trajectory] == pytest.approx(expected)
+        assert expected[-1] == 0
+
     def test_result_includes_summary(self):
         """Test that summary statistics are included."""
         calc = EnhancedMonteCarloCalculator(
@@ -374,6 +409,27 @@ class TestEdgeCases:
         p = result['final_value_percentiles']
         assert p['p5'] == p['p50'] == p['p95']
 
+    def test_zero_volatility_depletion_year_matches_trajectory(self):
+        """Test that monthly depletion is reported in the year the deterministic path runs out."""
+        calc = EnhancedMonteCarloCalculator(
+            portfolio_value=500000,
+            retirement_age=65,
+            life_expectancy=95,
+            annual_return_rate=0.05,
+            inflation_rate=0.03,
+            return_std_dev=0.0,
+            num_simulations=20,
+            withdrawal_amount=50000,
+        )
+        result = calc.calculate()
+
+        trajectory = result['constant_return_trajectory']
+        first_empty_year = next(point['year'] for point in trajectory if point['portfolio_value'] == 0)
+        assert result['success_rate'] == 0.0
+        assert result['depletion_stats']['count'] == 20
+        assert result['depletion_stats']['earliest_year'] == first_empty_year
+        assert result['depletion_stats']['latest_year'] == first_empty_year
+
     def test_short_retirement_period(self):
         """Test with very short retirement period."""
         calc = EnhancedMonteCarloCalculator(
@@ -464,3 +520,60 @@ class TestBinarySearch:
         # Higher success rate target should result in lower safe withdrawal
         # (more conservative)
         assert result_90['safe_withdrawal_annual'] <= result_75['safe_withdrawal_annual']
+
+    def test_found_withdrawal_is_not_simulated_again(self):
+        """Test that the reported success rate is the search run for the chosen withdrawal."""
+        calc = EnhancedMonteCarloCalculator(
+            portfolio_value=1000000,
+            retirement_age=65,
+            life_expectancy=90,
+            num_simulations=100,
+            mode='find_withdrawal',
+            target_success_rate=85,
+        )
+        with patch.object(calc, '_run_simulation', wraps=calc._run_simulation) as run_simulation:
+            result = calc.calculate()
+
+        simulated = [call.kwargs['annual_withdrawal'] for call in run_simulation.call_args_list]
+        assert simulated.count(result['safe_withdrawal_annual']) == 1
+
+
+@pytest.mark.unit
+class TestCommonRandomNumbers:
+    """Tests for reusing one random stream across simulation runs."""
+
+    def _calculator(self, **kwargs):
+        """Build a small annual-step calculator."""
+        return EnhancedMonteCarloCalculator(
+            portfolio_value=1000000,
+            retirement_age=65,
+            life_expectancy=90,
+            num_simulations=200,
+            periods_per_year=1,
+            **kwargs,
+        )
+
+    def test_same_seed_gives_same_result(self):
+        """Test that two calculators with the same seed produce identical results."""
+        first = self._calculator(withdrawal_amount=50000, seed=7).calculate()
+        second = self._calculator(withdrawal_amount=50000, seed=7).calculate()
+
+        assert first['success_rate'] == second['success_rate']
+        assert first['final_value_percentiles'] == second['final_value_percentiles']
+
+    def test_repeated_runs_share_market_paths(self):
+        """Test that every run of one calculator sees the same market paths."""
+        calc = self._calculator()
+
+        assert calc._run_simulation(annual_withdrawal=45000) == calc._run_simulation(annual_withdrawal=45000)
+
+    def test_success_rate_never_rises_with_withdrawal(self):
+        """Test that on shared paths a larger withdrawal never succeeds more often."""
+        calc = self._calculator()
+
+        rates = [
+            calc._run_simulation(annual_withdrawal=withdrawal)['success_rate']
+            for withdrawal in (30000, 40000, 50000, 60000, 70000)
+        ]
+
+        assert rates == sorted(rates, reverse=True)
@@ -60,6 +60,23 @@ class TestHistoricalDataModule:
         for i, r in enumerate(returns):
             assert abs(r - BOND_RETURNS[2000 + i]) < 0.0001
 
+    def test_get_returns_for_period_past_data_uses_average(self):
+        """Test that years beyond the data use the average blended return."""
+        avg_stock = sum(SP500_RETURNS.values()) / len(SP500_RETURNS)
+        avg_bond = sum(BOND_RETURNS.values()) / len(BOND_RETURNS)
+
+        returns = get_returns_for_period(2023, 4, 0.60)
+
+        assert returns[0] == pytest.approx(SP500_RETURNS[2023] * 0.6 + BOND_RETURNS[2023] * 0.4)
+        assert returns[2:] == [pytest.approx(avg_stock * 0.6 + avg_bond * 0.4)] * 2
+
+    def test_get_returns_for_period_returns_independent_lists(self):
+        """Test that modifying a returned list does not affect later lookups."""
+        returns = get_returns_for_period(1990, 3, 0.60)
+        returns[0] = 99.0
+
+        assert get_returns_for_period(1990, 3, 0.60)[0] != 99.0
+
     def test_get_inflation_for_period(self):
         """Test getting inflation rates for a period."""
         rates = get_inflation_for_period(1980, 10)
@@ -193,6 +210,22 @@ class TestHistoricalPeriodCalculator:
         assert 'start_year' in result['median_case']
         assert result['median_case']['final_portfolio_value'] >= 0
 
+    def test_best_worst_median_ties_keep_start_year_order(self):
+        """Test that periods tied at zero are picked in start-year order."""
+        calc = HistoricalPeriodCalculator(
+            portfolio_value=1000000,
+            retirement_age=60,
+            life_expectancy=95,
+            withdrawal_rate=0.12,
+        )
+        result = calc.calculate()
+
+        start_years = [r['start_year'] for r in result['period_results']]
+        assert result['success_rate'] == 0
+        assert result['worst_case']['start_year'] == start_years[0]
+        assert result['median_case']['start_year'] == start_years[len(start_years) // 2]
+        assert result['best_case']['start_year'] == start_years[-1]
+
     def test_percentiles_calculated(self):
         """Test that percentiles are calculated correctly."""
         calc = HistoricalPeriodCalculator(
@@ -236,6 +269,27 @@ class TestHistoricalPeriodCalculator:
         assert 'p95' in first_year
         assert 'mean' in first_year
 
+    def test_yearly_percentiles_match_per_year_values(self):
+        """Test batched yearly percentiles match percentiles of each year's values."""
+        import numpy as np
+
+        calc = HistoricalPeriodCalculator(
+            portfolio_value=1000000,
+            retirement_age=65,
+            life_expectancy=90,
+            withdrawal_rate=0.05,
+        )
+        result = calc.calculate()
+
+        yearly = result['yearly_percentiles']
+        assert len(yearly) == calc.years_in_retirement + 1
+        for entry in yearly:
+            year_values = [r['yearly_values'][entry['year']] for r in result['period_results']]
+            assert entry['age'] == 65 + entry['year']
+            assert entry['p25'] == pytest.approx(np.percentile(year_values, 25))
+            assert entry['p90'] == pytest.approx(np.percentile(year_values, 90))
+            assert entry['mean'] == pytest.approx(np.mean(year_values))
+
     def test_notable_periods_analyzed(self):
         """Test that notable historical periods are analyzed."""
         calc = HistoricalPeriodCalculator(
@@ -256,6 +310,59 @@ class TestHistoricalPeriodCalculator:
             assert 'success' in period
             assert 'final_portfolio_value' in period
 
+    def test_period_yearly_details_follow_withdrawal_rules(self):
+        """Test that each period's yearly details chain together year over year."""
+        calc = HistoricalPeriodCalculator(
+            portfolio_value=600000,
+            retirement_age=62,
+            life_expectancy=92,
+            withdrawal_amount=50000,
+            social_security_start_age=67,
+            social_security_annual=20000,
+            pension_annual=6000,
+        )
+        result = calc.calculate()
+
+        for period in result['period_results']:
+            details = period['yearly_details']
+            assert len(details) == calc.years_in_retirement
+            assert details[0]['gross_withdrawal'] == pytest.approx(50000)
+            for prev, year in zip(details, details[1:]):
+                assert year['portfolio_start'] == prev['portfolio_end']
+                assert year['gross_withdrawal'] == pytest.approx(
+                    prev['gross_withdrawal'] * (1 + get_inflation_for_period(prev['calendar_year'], 1)[0])
+                )
+            for year in details:
+                ss = 20000 if year['age'] >= 67 else 0
+                assert year['social_security'] == ss
+                assert year['net_withdrawal'] == pytest.approx(max(0, year['gross_withdrawal'] - ss - 6000))
+                assert year['portfolio_end'] == pytest.approx(
+                    max(0, year['portfolio_start'] + year['investment_gain'] - year['net_withdrawal'])
+                )
+            assert period['yearly_values'] == [details[0]['portfolio_start']] + [d['portfolio_end'] for d in details]
+            assert period['final_portfolio_value'] == period['yearly_values'][-1]
+            assert period['total_withdrawals'] == pytest.approx(sum(d['net_withdrawal'] for d in details))
+
+    def test_summary_only_simulation_skips_yearly_details(self):
+        """Test that collect_details=False leaves the summary unchanged without yearly details."""
+        calc = HistoricalPeriodCalculator(
+            portfolio_value=1000000,
+            retirement_age=65,
+            life_expectancy=90,
+            withdrawal_rate=0.05,
+        )
+        start_years = [1966, 1973, 2000]
+        returns = [get_returns_for_period(y, calc.years_in_retirement, calc.stock_allocation) for y in start_years]
+        inflation = [get_inflation_for_period(y, calc.years_in_retirement) for y in start_years]
+
+        detailed = calc._simulate_periods(start_years, returns, inflation)
+        summary = calc._simulate_periods(start_years, returns, inflation, collect_details=False)
+
+        for full, brief in zip(detailed, summary):
+            assert len(full['yearly_details']) == calc.years_in_retirement
+            assert brief['yearly_details'] == []
+            assert {**full, 'yearly_details': []} == brief
+
     def test_social_security_reduces_failures(self):
         """Test that Social Security income reduces failures."""
         # Without SS
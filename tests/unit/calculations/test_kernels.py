@@ -0,0 +1,82 @@
+"""
+Unit tests for the Monte Carlo simulation kernels.
+"""
+
+import pytest
+import numpy as np
+from jretirewise.calculations.kernels import simulate_gbm_withdrawals, simulate_withdrawals
+
+
+def _reference_paths(starting_value, returns, withdrawals):
+    """Scalar reference implementation of the withdrawal recurrence."""
+    paths = []
+    for path_returns in returns.T:
+        portfolio = starting_value
+        values = [portfolio]
+        for annual_return, withdrawal in zip(path_returns, withdrawals):
+            portfolio = max(0.0, portfolio * (1 + annual_return) - withdrawal)
+            values.append(portfolio)
+        paths.append(values)
+    return np.array(paths).T
+
+
+@pytest.mark.unit
+class TestSimulateWithdrawals:
+    """Tests for simulate_withdrawals."""
+
+    def test_matches_scalar_reference(self):
+        """Test that the kernel matches a per-path scalar loop."""
+        rng = np.random.default_rng(0)
+        returns = rng.normal(0.05, 0.2, size=(30, 50))
+        withdrawals = 40000 * 1.03 ** np.arange(1, 31)
+
+        result = simulate_withdrawals(1000000.0, returns, withdrawals)
+
+        assert result.shape == (31, 50)
+        np.testing.assert_allclose(result, _reference_paths(1000000.0, returns, withdrawals))
+
+    def test_depleted_paths_stay_at_zero(self):
+        """Test that a depleted portfolio is floored at zero for the remaining years."""
+        returns = np.full((5, 2), -0.5)
+        withdrawals = np.full(5, 30000.0)
+
+        result = simulate_withdrawals(100000.0, returns, withdrawals)
+
+        assert (result[2:] == 0).all()
+        assert (result >= 0).all()
+
+
+@pytest.mark.unit
+class TestSimulateGbmWithdrawals:
+    """Tests for simulate_gbm_withdrawals."""
+
+    def test_matches_scalar_reference(self):
+        """Test that the kernel matches a per-path scalar GBM loop."""
+        rng = np.random.default_rng(0)
+        starting_values = rng.uniform(0, 1000000, size=40)
+        shocks = rng.standard_normal((12, 40))
+        withdrawals = np.full(12, 5000.0)
+
+        result = simulate_gbm_withdrawals(starting_values, shocks, 0.004, 0.05, withdrawals)
+
+        expected = []
+        for sim, portfolio in enumerate(starting_values):
+            for period in range(12):
+                portfolio = max(0.0, portfolio * np.exp(0.004 + 0.05 * shocks[period, sim]) - withdrawals[period])
+            expected.append(portfolio)
+        np.testing.assert_allclose(result, expected)
+
+    def test_does_not_modify_starting_values(self):
+        """Test that the starting values are left untouched."""
+        starting_values = np.full(3, 100000.0)
+
+        result = simulate_gbm_withdrawals(starting_values, np.zeros((12, 3)), 0.0, 0.1, np.full(12, 1000.0))
+
+        assert (starting_values == 100000.0).all()
+        np.testing.assert_allclose(result, 88000.0)
+
+    def test_depleted_paths_stay_at_zero(self):
+        """Test that a depleted portfolio is floored at zero."""
+        result = simulate_gbm_withdrawals(np.array([0.0, 1000.0]), np.zeros((4, 2)), 0.0, 0.2, np.full(4, 600.0))
+
+        np.testing.assert_array_equal(result, [0.0, 0.0])
@@ -4,7 +4,9 @@ Unit tests for retirement calculators.
 
 import pytest
 from decimal import Decimal
-from jretirewise.calculations.calculators import FourPercentCalculator, FourPointSevenPercentCalculator
+from jretirewise.calculations.calculators import (
+    FourPercentCalculator, FourPointSevenPercentCalculator, MonteCarloCalculator,
+)
 
 
 @pytest.mark.unit
@@ -224,3 +226,109 @@ class TestFourPointSevenPercentCalculator:
 
         # 4.7% withdrawal should be higher
         assert withdrawal_47pct > withdrawal_4pct
+
+
+@pytest.mark.unit
+class TestMonteCarloCalculator:
+    """Tests for Monte Carlo calculator."""
+
+    def test_zero_volatility_matches_deterministic_projection(self):
+        """Test that with no volatility every simulation follows the same path."""
+        calc = MonteCarloCalculator(
+            portfolio_value=1000000,
+            annual_spending=40000,
+            current_age=60,
+            retirement_age=65,
+            life_expectancy=95,
+            annual_return_rate=0.05,
+            inflation_rate=0.03,
+            return_std_dev=0.0,
+            num_simulations=50,
+        )
+        result = calc.calculate()
+
+        # Replay the recurrence by hand for a single path
+        portfolio = 1000000.0
+        withdrawal = 40000.0
+        for _ in range(30):
+            withdrawal *= 1.03
+            portfolio = max(0.0, portfolio * 1.05 - withdrawal)
+
+        assert len(result['yearly_percentiles']) == 31
+        assert result['final_value_percentiles']['p5'] == pytest.approx(portfolio)
+        assert result['final_value_percentiles']['p95'] == pytest.approx(portfolio)
+
+    def test_depletion_stats(self):
+        """Test that depleted simulations report the first year they hit zero."""
+        calc = MonteCarloCalculator(
+            portfolio_value=100000,
+            annual_spending=40000,
+            current_age=60,
+            retirement_age=65,
+            life_expectancy=95,
+            annual_return_rate=-0.5,
+            inflation_rate=0.0,
+            return_std_dev=0.0,
+            num_simulations=20,
+        )
+        result = calc.calculate()
+
+        # 100k -> 46k -> 19k -> 5.5k -> 0 in year 4
+        assert result['success_rate'] == 0
+        assert result['failed_simulations'] == 20
+        assert result['depletion_stats']['earliest_year'] == 4
+        assert result['depletion_stats']['latest_year'] == 4
+        assert result['depletion_stats']['earliest_age'] == 69
+
+    def test_no_years_in_retirement(self):
+        """Test that a zero-length retirement returns the starting value."""
+        calc = MonteCarloCalculator(
+            portfolio_value=500000,
+            annual_spending=40000,
+            current_age=60,
+            retirement_age=90,
+            life_expectancy=90,
+            num_simulations=10,
+        )
+        result = calc.calculate()
+
+        assert result['success_rate'] == 100
+        assert result['depletion_stats'] is None
+        assert result['final_value_percentiles']['p50'] == 500000
+
+    def test_seed_makes_results_reproducible(self):
+        """Test that the same seed gives the same simulations."""
+        params = dict(
+            portfolio_value=1000000,
+            annual_spending=40000,
+            current_age=60,
+            retirement_age=65,
+            life_expectancy=95,
+            num_simulations=200,
+        )
+
+        first = MonteCarloCalculator(**params, seed=42).calculate()
+        second = MonteCarloCalculator(**params, seed=42).calculate()
+        other = MonteCarloCalculator(**params, seed=7).calculate()
+
+        assert first['yearly_percentiles'] == second['yearly_percentiles']
+        assert first['final_value_percentiles'] != other['final_value_percentiles']
+
+    def test_seeded_results_are_cached_copies(self):
+        """Test that repeated seeded runs reuse the result without sharing it."""
+        params = dict(
+            portfolio_value=1000000,
+            annual_spending=40000,
+            current_age=60,
+            retirement_age=65,
+            life_expectancy=95,
+            num_simulations=200,
+            seed=11,
+        )
+
+        first = MonteCarloCalculator(**params).calculate()
+        first['yearly_percentiles'][0]['p50'] = -1
+        second = MonteCarloCalculator(**params).calculate()
+
+        assert second['yearly_percentiles'][0]['p50'] == 1000000
+        assert second is not first